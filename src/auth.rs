@@ -5,8 +5,16 @@ use axum::response::{IntoResponse, Response};
 use chrono::{DateTime, Duration, Utc};
 use jsonwebtoken::{decode, encode, DecodingKey, EncodingKey, Header, TokenData, Validation};
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
+use std::time::Instant;
 use uuid::Uuid;
 
+/// How long a verified API key token is served from the verify cache
+const API_KEY_CACHE_TTL: std::time::Duration = std::time::Duration::from_secs(10);
+/// Upper bound on cached API key tokens
+const API_KEY_CACHE_CAPACITY: usize = 10_000;
+
 #[derive(Debug, Serialize, Deserialize)]
 pub struct Claims {
     pub user_id: Uuid,
@@ -16,7 +24,7 @@ pub struct Claims {
     pub iat: i64,
 }
 
-#[derive(Debug, Serialize, Deserialize)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ApiKeyClaims {
     pub api_key_id: Uuid,
     pub user_id: Uuid,
@@ -72,6 +80,8 @@ impl ApiKeyClaims {
 pub struct JwtManager {
     encoding_key: EncodingKey,
     decoding_key: DecodingKey,
+    // Verified API key tokens and when they were verified; shared by clones
+    api_key_cache: Arc<Mutex<HashMap<String, (TokenData<ApiKeyClaims>, Instant)>>>,
 }
 
 impl JwtManager {
@@ -79,6 +89,7 @@ impl JwtManager {
         Self {
             encoding_key: EncodingKey::from_secret(secret.as_bytes()),
             decoding_key: DecodingKey::from_secret(secret.as_bytes()),
+            api_key_cache: Arc::new(Mutex::new(HashMap::new())),
         }
     }
 
@@ -97,9 +108,48 @@ impl JwtManager {
             .map_err(|_| AuthError::InvalidToken)
     }
 
+    /// Verify an API key token, reusing a recent successful verification.
+    ///
+    /// Every Redis HTTP API request carries an API key, so verified tokens are
+    /// cached for a few seconds. Cache hits skip the signature check but still
+    /// enforce `exp`; failed verifications are never cached.
     pub fn verify_api_key_token(&self, token: &str) -> Result<TokenData<ApiKeyClaims>, AuthError> {
-        decode::<ApiKeyClaims>(token, &self.decoding_key, &Validation::default())
-            .map_err(|_| AuthError::InvalidToken)
+        if let Some(token_data) = self.cached_api_key_token(token) {
+            return Ok(token_data);
+        }
+
+        let token_data = decode::<ApiKeyClaims>(token, &self.decoding_key, &Validation::default())
+            .map_err(|_| AuthError::InvalidToken)?;
+
+        if let Ok(mut cache) = self.api_key_cache.lock() {
+            if cache.len() >= API_KEY_CACHE_CAPACITY {
+                cache.retain(|_, (_, verified_at)| verified_at.elapsed() < API_KEY_CACHE_TTL);
+                if cache.len() >= API_KEY_CACHE_CAPACITY {
+                    cache.clear();
+                }
+            }
+            cache.insert(token.to_string(), (token_data.clone(), Instant::now()));
+        }
+
+        Ok(token_data)
+    }
+
+    fn cached_api_key_token(&self, token: &str) -> Option<TokenData<ApiKeyClaims>> {
+        let mut cache = self.api_key_cache.lock().ok()?;
+        match cache.get(token) {
+            Some((token_data, verified_at))
+                if verified_at.elapsed() < API_KEY_CACHE_TTL
+                    && token_data.claims.exp > Utc::now().timestamp() =>
+            {
+                return Some(token_data.clone());
+            }
+            Some(_) => {}
+            None => return None,
+        }
+
+        // Stale or expired: drop it so the token is verified again
+        cache.remove(token);
+        None
     }
 }
 
@@ -204,6 +254,31 @@ mod tests {
         assert_eq!(verified.claims.key_prefix, key_prefix);
     }
 
+    #[test]
+    fn test_api_key_token_verification_is_cached() {
+        let jwt_manager = JwtManager::new("test-secret");
+        let claims = ApiKeyClaims::new(
+            Uuid::new_v4(),
+            Uuid::new_v4(),
+            Uuid::new_v4(),
+            vec!["read".to_string()],
+            "rg_test".to_string(),
+            None,
+        );
+        let token = jwt_manager.create_api_key_token(&claims).unwrap();
+
+        let first = jwt_manager.verify_api_key_token(&token).unwrap();
+        assert_eq!(jwt_manager.api_key_cache.lock().unwrap().len(), 1);
+
+        // A clone shares the cache and returns the same claims
+        let second = jwt_manager.clone().verify_api_key_token(&token).unwrap();
+        assert_eq!(second.claims.api_key_id, first.claims.api_key_id);
+
+        // Failures are not cached
+        assert!(jwt_manager.verify_api_key_token("invalid-token").is_err());
+        assert_eq!(jwt_manager.api_key_cache.lock().unwrap().len(), 1);
+    }
+
     #[test] 
     fn test_invalid_token_verification() {
         let jwt_manager = JwtManager::new("test-secret");
@@ -294,13 +294,17 @@ pub async fn handle_del(
 }
 
 /// Handle generic Redis command via POST with JSON body
+///
+/// The body is either a single command (`["SET", "k", "v"]`), answered with
+/// `{"result": ...}`, or a pipeline of commands (`[["SET", "k", "v"], ["GET", "k"]]`),
+/// run in order on one connection and answered with `{"results": [...]}`.
 pub async fn handle_generic_command(
     State(state): State<Arc<AppState>>,
     Path(instance_id): Path<Uuid>,
     Query(query): Query<HashMap<String, String>>,
     headers: HeaderMap,
     Json(payload): Json<Vec<Value>>,
-) -> Result<Json<RedisResponse>, ErrorResponse> {
+) -> Result<Json<Value>, ErrorResponse> {
     let api_key = extract_api_key(&headers, &Query(query)).ok_or_else(|| {
         (
             StatusCode::UNAUTHORIZED,
@@ -311,7 +315,32 @@ pub async fn handle_generic_command(
     let (instance, _claims) = authenticate_and_get_instance(&state, &api_key, instance_id).await?;
     let mut conn = get_redis_connection(&instance).await?;
 
-    if payload.is_empty() {
+    // A leading array means the body is a pipeline of commands
+    if payload.first().map_or(false, Value::is_array) {
+        let mut results = Vec::with_capacity(payload.len());
+        for entry in &payload {
+            let command_parts = entry.as_array().ok_or_else(|| {
+                (
+                    StatusCode::BAD_REQUEST,
+                    Json(json!({"error": "Invalid pipeline format"})),
+                )
+            })?;
+            let result = execute_command(&mut conn, command_parts)?;
+            results.push(redis_value_to_json(result));
+        }
+
+        info!("Executed pipeline of {} Redis commands", results.len());
+        return Ok(Json(json!({ "results": results })));
+    }
+
+    let result = execute_command(&mut conn, &payload)?;
+
+    Ok(Json(json!({ "result": redis_value_to_json(result) })))
+}
+
+/// Execute one command given as `[command, args...]` on an open connection
+fn execute_command(conn: &mut Connection, command_parts: &[Value]) -> Result<redis::Value, ErrorResponse> {
+    if command_parts.is_empty() {
         return Err((
             StatusCode::BAD_REQUEST,
             Json(json!({"error": "Empty command"})),
@@ -319,14 +348,14 @@ pub async fn handle_generic_command(
     }
 
     // Extract command and arguments
-    let command = payload[0].as_str().ok_or_else(|| {
+    let command = command_parts[0].as_str().ok_or_else(|| {
         (
             StatusCode::BAD_REQUEST,
             Json(json!({"error": "Invalid command format"})),
         )
     })?;
 
-    let args: Vec<String> = payload[1..]
+    let args: Vec<String> = command_parts[1..]
         .iter()
         .map(|v| match v {
             Value::String(s) => s.clone(),
@@ -339,7 +368,7 @@ pub async fn handle_generic_command(
 
     let result = match command.to_uppercase().as_str() {
         "PING" => {
-            let result: String = redis::cmd("PING").query(&mut conn).map_err(|e| {
+            let result: String = redis::cmd("PING").query(conn).map_err(|e| {
                 error!("Redis PING failed: {}", e);
                 (
                     StatusCode::INTERNAL_SERVER_ERROR,
@@ -816,7 +845,7 @@ pub async fn handle_generic_command(
             for arg in &args {
                 cmd.arg(arg);
             }
-            cmd.query(&mut conn).map_err(|e| {
+            cmd.query(conn).map_err(|e| {
                 error!("Redis command {} failed: {}", command, e);
                 (
                     StatusCode::INTERNAL_SERVER_ERROR,
@@ -826,9 +855,7 @@ pub async fn handle_generic_command(
         }
     };
 
-    Ok(Json(RedisResponse {
-        result: redis_value_to_json(result),
-    }))
+    Ok(result)
 }
 
 /// Debug handler to see what requests are coming in
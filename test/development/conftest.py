@@ -6,137 +6,355 @@ This module provides:
 - HTTP client setup
 - Test data generation and cleanup
 - Authentication helpers
+- Optional on-disk JWT cache (``--use-token-cache``)
 """
 
 import asyncio
+import hashlib
+import itertools
+import json
 import os
+import sys
 import time
 from pathlib import Path
-from typing import AsyncGenerator, Dict, Any, Optional
-from uuid import uuid4
+from typing import AsyncGenerator, Dict, Any, Mapping, Optional
 
 import httpx
 import pytest
 import pytest_asyncio
 from rich.console import Console
 
-# Configure rich console for better test output
-console = Console()
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# Use uvloop for the session event loop when available (faster socket I/O)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Configure rich console for better test output (plain output when not on a TTY)
+IS_TTY = sys.stdout.isatty()
+console = Console(force_terminal=IS_TTY, no_color=not IS_TTY, highlight=False)
 
 # Test configuration
 TEST_HOST = os.getenv("REDISGATE_TEST_HOST", "127.0.0.1")
 TEST_PORT = int(os.getenv("REDISGATE_TEST_PORT", "8080"))
 BASE_URL = f"http://{TEST_HOST}:{TEST_PORT}"
 CLIENT_TIMEOUT = 10   # seconds for client operations
+SERVER_WAIT_TIMEOUT = 30  # seconds to wait for the server to become healthy
+# Headers for requests whose body is pre-encoded with json_body()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Set once the health check succeeds so later readiness checks are no-ops.
+# run_tests.py has already probed the server before starting pytest, so it
+# pre-sets this for every worker through REDISGATE_TEST_SERVER_READY.
+_server_ready = os.getenv("REDISGATE_TEST_SERVER_READY") == "1"
+
+# Connection pool per client: the largest fan-out in one worker is the 32-wide
+# ping burst, so 64 connections leave headroom and half of them stay alive
+# between tests.
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+
+# Token cache configuration (opt-in via --use-token-cache)
+TOKEN_CACHE_FILE = Path(__file__).parent / ".cache" / "tokens.json"
+CACHED_USERNAME = "testuser_cached"
+TEST_PASSWORD = "TestPassword123!"
+
+# Process-wide unique suffix source for test data names. Session fixtures run
+# once per pytest-xdist worker, so the worker id keeps parallel workers from
+# colliding on usernames and organization slugs.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+_COUNTER = itertools.count()
+_PREFIX = f"{WORKER_ID}{os.getpid():x}{time.monotonic_ns():x}"
+
+
+def _uniq() -> str:
+    """Return a short name suffix that is unique within this test run."""
+    return f"{_PREFIX}{next(_COUNTER):x}"
+
+
+def pytest_addoption(parser):
+    """Register command line options for the development test suite."""
+    parser.addoption(
+        "--use-token-cache",
+        action="store_true",
+        default=False,
+        help="Reuse a cached JWT for the test user across runs (stored in .cache/tokens.json)"
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the latency benchmarks (tests marked benchmark); skipped by default"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked ``benchmark`` unless --benchmark is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="latency benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+def _token_cache_key(email: str, password: str) -> str:
+    """Build the cache key for a set of credentials on the configured server."""
+    return hashlib.sha256(f"{BASE_URL}|{email}|{password}".encode()).hexdigest()
+
+
+def _load_token_cache() -> Dict[str, Any]:
+    """Read the token cache, returning an empty cache if it is missing or corrupt."""
+    try:
+        with open(TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_token_cache(cache: Dict[str, Any]) -> None:
+    """Atomically write the token cache to disk.
+    
+    The temporary file is per process, so xdist workers saving at the same
+    time never write into each other's file before the rename.
+    """
+    TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = TOKEN_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_file, TOKEN_CACHE_FILE)
+
+
+def jload(response: httpx.Response) -> Any:
+    """Parse a response body as JSON, using orjson when available."""
+    return _json_loads(response.content)
 
 
 class ApiClient:
-    """Simple HTTP client wrapper for RedisGate API testing."""
+    """Simple HTTP client wrapper for RedisGate API testing.
+    
+    Owns one pooled ``httpx.AsyncClient`` for its whole lifetime so every
+    request reuses keep-alive connections.
+    """
     
-    def __init__(self, base_url: str, timeout: int = CLIENT_TIMEOUT):
+    def __init__(self, base_url: str, timeout: int = CLIENT_TIMEOUT, headers: Optional[Dict] = None):
         self.base_url = base_url
         self.timeout = timeout
-        self._client = None
-        
-    async def __aenter__(self):
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self.timeout,
-            follow_redirects=True
+            headers=headers,
+            timeout=httpx.Timeout(self.timeout),
+            follow_redirects=True,
+            # The transport owns pooling; HTTP/2 multiplexes concurrent requests
+            # on one connection where the server negotiates it (TLS/ALPN)
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=0, limits=CLIENT_LIMITS)
         )
+        
+    async def __aenter__(self):
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        await self.close()
+    
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+    
+    @staticmethod
+    def json(response: httpx.Response) -> Any:
+        """Parse a response body as JSON (using orjson when available)."""
+        return jload(response)
+    
+    async def request(self, method: str, url: str, headers: Optional[Dict] = None, content: Optional[bytes] = None) -> httpx.Response:
+        """Make a request with an arbitrary method."""
+        return await self._client.request(method, url, headers=headers, content=content)
     
     async def get(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None) -> httpx.Response:
         """Make GET request."""
         return await self._client.get(url, headers=headers, params=params)
     
-    async def post(self, url: str, json: Optional[Dict] = None, headers: Optional[Dict] = None, params: Optional[Dict] = None) -> httpx.Response:
-        """Make POST request."""
-        return await self._client.post(url, json=json, headers=headers, params=params)
+    async def get_noauth(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """Make GET request without the client's default Authorization header."""
+        request = self._client.build_request("GET", url, params=params)
+        request.headers.pop("Authorization", None)
+        return await self._client.send(request)
+    
+    async def head(self, url: str, headers: Optional[Dict] = None) -> httpx.Response:
+        """Make HEAD request (status and headers only, no body)."""
+        return await self._client.head(url, headers=headers)
     
-    async def put(self, url: str, json: Optional[Dict] = None, headers: Optional[Dict] = None) -> httpx.Response:
+    @staticmethod
+    def _encode(json: Any, headers: Optional[Dict]) -> tuple:
+        """Encode a ``json=`` body with orjson (when available) and add the JSON content type."""
+        return _json_dumps(json), {**JSON_HEADERS, **headers} if headers else JSON_HEADERS
+    
+    async def post(self, url: str, json: Optional[Any] = None, headers: Optional[Dict] = None, params: Optional[Dict] = None, content: Optional[bytes] = None) -> httpx.Response:
+        """Make POST request (``content`` sends a pre-encoded body as-is)."""
+        if json is not None:
+            content, headers = self._encode(json, headers)
+        return await self._client.post(url, headers=headers, params=params, content=content)
+    
+    async def put(self, url: str, json: Optional[Any] = None, headers: Optional[Dict] = None) -> httpx.Response:
         """Make PUT request."""
-        return await self._client.put(url, json=json, headers=headers)
+        content = None
+        if json is not None:
+            content, headers = self._encode(json, headers)
+        return await self._client.put(url, headers=headers, content=content)
     
     async def delete(self, url: str, headers: Optional[Dict] = None) -> httpx.Response:
         """Make DELETE request."""
         return await self._client.delete(url, headers=headers)
 
 
-@pytest_asyncio.fixture
+def _assert_status(response: httpx.Response, message: str, *expected: int) -> None:
+    """Fail with the response body if the status is not one of ``expected`` (default 200).
+    
+    The body is only decoded on the failure path, and the check is not
+    stripped when Python runs with ``-O``.
+    """
+    if response.status_code not in (expected or (200,)):
+        raise AssertionError(f"{message}: {response.status_code} {response.text}")
+
+
+def expect(response: httpx.Response, status_code: int) -> Any:
+    """Assert the response status and return the parsed JSON body (None if empty)."""
+    _assert_status(response, "Unexpected status", status_code)
+    return jload(response) if response.content else None
+
+
+@pytest_asyncio.fixture(scope="session")
 async def api_client() -> AsyncGenerator[ApiClient, None]:
-    """Provide an HTTP client for API testing."""
-    async with ApiClient(BASE_URL) as client:
-        yield client
+    """Provide an HTTP client for API testing, shared across the session.
+    
+    All tests reuse one connection pool. Pass auth headers per request and do
+    not close or reconfigure this client; build a local ``ApiClient`` instead.
+    """
+    client = ApiClient(BASE_URL)
+    yield client
+    await client.close()
 
 
-@pytest_asyncio.fixture
-async def wait_for_server():
-    """Wait for RedisGate server to be available."""
-    max_attempts = 30
-    for attempt in range(max_attempts):
+@pytest_asyncio.fixture(scope="session")
+async def wait_for_server(api_client: ApiClient):
+    """Wait once per session for RedisGate server to be available."""
+    global _server_ready
+    if _server_ready:
+        return
+    deadline = time.monotonic() + SERVER_WAIT_TIMEOUT
+    attempt = 0
+    while True:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{BASE_URL}/health", timeout=5.0)
-                if response.status_code == 200:
-                    console.print(f"[green]Server is ready at {BASE_URL}[/green]")
-                    return
+            response = await api_client.get("/health")
+            if response.status_code == 200:
+                console.print(f"[green]Server is ready at {BASE_URL} ({response.http_version})[/green]")
+                _server_ready = True
+                return
         except (httpx.ConnectError, httpx.TimeoutException):
-            if attempt < max_attempts - 1:
-                console.print(f"[yellow]Waiting for server... (attempt {attempt + 1}/{max_attempts})[/yellow]")
-                await asyncio.sleep(2)
-            else:
-                raise ConnectionError(f"Server not available at {BASE_URL} after {max_attempts} attempts")
+            pass
+        
+        if time.monotonic() >= deadline:
+            raise ConnectionError(f"Server not available at {BASE_URL} after {SERVER_WAIT_TIMEOUT}s")
+        if attempt % 5 == 0:
+            console.print(f"[yellow]Waiting for server... (attempt {attempt + 1})[/yellow]")
+        # Exponential backoff: 50 ms, 100 ms, 200 ms, ... capped at 500 ms
+        await asyncio.sleep(min(0.5, 0.05 * 2 ** min(attempt, 4)))
+        attempt += 1
 
 
-@pytest_asyncio.fixture
-async def auth_user(api_client: ApiClient):
-    """Create a test user and return authentication data."""
-    # Generate unique test data
-    username = f"testuser_{uuid4().hex[:8]}"
+async def _register_and_login(api_client: ApiClient, username: str, allow_existing: bool = False) -> Dict[str, Any]:
+    """Register a user and log in; registration returns no token, so both calls are needed."""
     email = f"{username}@example.com"
-    password = "TestPassword123!"
     
     # Register user
     register_data = {
         "username": username,
         "email": email,
-        "password": password
+        "password": TEST_PASSWORD
     }
     
     register_response = await api_client.post("/auth/register", json=register_data)
-    assert register_response.status_code == 200, f"Registration failed: {register_response.text}"
+    allowed_statuses = (200, 409) if allow_existing else (200,)
+    _assert_status(register_response, "Registration failed", *allowed_statuses)
     
     # Login to get JWT token
     login_data = {
         "email": email,
-        "password": password
+        "password": TEST_PASSWORD
     }
     
     login_response = await api_client.post("/auth/login", json=login_data)
-    assert login_response.status_code == 200, f"Login failed: {login_response.text}"
+    _assert_status(login_response, "Login failed")
     
-    login_result = login_response.json()
+    login_result = api_client.json(login_response)
     
     return {
         "user_id": login_result["data"]["user"]["id"],
         "username": username,
         "email": email,
         "jwt_token": login_result["data"]["token"],
-        "auth_headers": {"Authorization": f"Bearer {login_result['data']['token']}"}
     }
 
 
-@pytest_asyncio.fixture  
-async def test_organization(api_client: ApiClient, auth_user: Dict[str, Any]):
-    """Create a test organization and return its data."""
+# Resource fixtures below are session-scoped: one user (a single registration,
+# i.e. a single server-side password hash) and one organization are shared by
+# the whole run. Tests that mutate these resources or need an isolated user
+# should build a module-scoped sub-fixture on top of them (or use
+# ``auth_user_fresh`` for a per-test user) rather than going back to function scope.
+@pytest_asyncio.fixture(scope="session")
+async def auth_user(request, api_client: ApiClient, wait_for_server):
+    """Create a test user once per session and return authentication data.
+
+    With ``--use-token-cache`` a fixed user is reused and its JWT is read from
+    disk, skipping registration and login while the cached token is accepted.
+    """
+    use_token_cache = request.config.getoption("--use-token-cache")
+    
+    # Generate unique test data (a stable user when the token cache is in use)
+    username = CACHED_USERNAME if use_token_cache else f"testuser_{_uniq()}"
+    email = f"{username}@example.com"
+    
+    if use_token_cache:
+        cache_key = _token_cache_key(email, TEST_PASSWORD)
+        token_cache = _load_token_cache()
+        cached = token_cache.get(cache_key)
+        if cached:
+            auth_headers = {"Authorization": f"Bearer {cached['jwt_token']}"}
+            check_response = await api_client.get("/api/organizations", headers=auth_headers)
+            if check_response.status_code == 200:
+                return {**cached, "auth_headers": auth_headers}
+    
+    # The cached user may already exist, in which case only the token needs refreshing
+    user_data = await _register_and_login(api_client, username, allow_existing=use_token_cache)
+    
+    if use_token_cache:
+        token_cache[cache_key] = user_data
+        _save_token_cache(token_cache)
+    
+    return {**user_data, "auth_headers": {"Authorization": f"Bearer {user_data['jwt_token']}"}}
+
+
+@pytest_asyncio.fixture
+async def auth_user_fresh(api_client: ApiClient, wait_for_server):
+    """Create a brand-new user for a test that must not share the session user."""
+    user_data = await _register_and_login(api_client, f"testuser_{_uniq()}")
+    return {**user_data, "auth_headers": {"Authorization": f"Bearer {user_data['jwt_token']}"}}
+
+
+async def _create_organization(api_client: ApiClient, auth_user: Dict[str, Any]) -> Dict[str, Any]:
+    """Create an organization owned by the given user and return its data."""
     org_data = {
-        "name": f"Test Organization {uuid4().hex[:8]}",
-        "slug": f"test-org-{int(time.time() * 1000000)}",  # Use microsecond timestamp for uniqueness
+        "name": f"Test Organization {_uniq()}",
+        "slug": unique_slug("test-org"),
         "description": "Test organization for development testing"
     }
     
@@ -145,18 +363,33 @@ async def test_organization(api_client: ApiClient, auth_user: Dict[str, Any]):
         json=org_data,
         headers=auth_user["auth_headers"]
     )
-    assert response.status_code == 200, f"Organization creation failed: {response.text}"
+    _assert_status(response, "Organization creation failed")
     
-    return response.json()["data"]
+    return api_client.json(response)["data"]
 
 
-@pytest_asyncio.fixture
-async def test_api_key(api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any]):
-    """Create a test API key and return its data."""
-    org_id = test_organization["id"]
+@pytest_asyncio.fixture(scope="session")
+async def test_organization(api_client: ApiClient, auth_user: Dict[str, Any]):
+    """Create a test organization once per session and return its data."""
+    return await _create_organization(api_client, auth_user)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def mutable_organization(api_client: ApiClient, auth_user: Dict[str, Any]):
+    """Create an organization that tests in one module may modify.
+    
+    Keeps updates away from the session ``test_organization``, whose fields
+    other tests assert on.
+    """
+    return await _create_organization(api_client, auth_user)
+
+
+async def _create_api_key(api_client: ApiClient, auth_user: Dict[str, Any], organization: Dict[str, Any]) -> Dict[str, Any]:
+    """Create an API key in the given organization and return its data."""
+    org_id = organization["id"]
     
     api_key_data = {
-        "name": f"Test API Key {uuid4().hex[:8]}",
+        "name": f"Test API Key {_uniq()}",
         "organization_id": org_id,
         "scopes": ["read", "write"],  # Changed from permissions to scopes
         "expires_at": None  # No expiration for testing
@@ -167,10 +400,10 @@ async def test_api_key(api_client: ApiClient, auth_user: Dict[str, Any], test_or
         json=api_key_data,
         headers=auth_user["auth_headers"]
     )
-    assert response.status_code == 200, f"API key creation failed: {response.text}"
+    _assert_status(response, "API key creation failed")
     
     # The response structure has changed with JWT tokens
-    response_data = response.json()["data"]
+    response_data = api_client.json(response)["data"]
     return {
         "id": response_data["api_key"]["id"],
         "name": response_data["api_key"]["name"],
@@ -181,13 +414,12 @@ async def test_api_key(api_client: ApiClient, auth_user: Dict[str, Any], test_or
     }
 
 
-@pytest_asyncio.fixture
-async def test_redis_instance(api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any]):
-    """Create a test Redis instance and return its data."""
-    org_id = test_organization["id"]
+async def _create_redis_instance(api_client: ApiClient, auth_user: Dict[str, Any], organization: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a Redis instance in the given organization and return its data."""
+    org_id = organization["id"]
     
     instance_data = {
-        "name": f"Test Redis Instance {uuid4().hex[:8]}",
+        "name": f"Test Redis Instance {_uniq()}",
         "redis_url": "redis://localhost:6379/0",  # Assuming local Redis for development
         "port": 6379,
         "database": 0,
@@ -199,16 +431,96 @@ async def test_redis_instance(api_client: ApiClient, auth_user: Dict[str, Any],
         json=instance_data,
         headers=auth_user["auth_headers"]
     )
-    assert response.status_code == 200, f"Redis instance creation failed: {response.text}"
+    _assert_status(response, "Redis instance creation failed")
     
-    return response.json()["data"]
+    return api_client.json(response)["data"]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_resources(api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any]):
+    """Create the session API key and Redis instance concurrently.
+    
+    Both only depend on the user and organization, so the two creation
+    requests are issued together and the fixture returns ``(api_key, instance)``.
+    The instance is shared by every test on this worker and deleted at the end.
+    """
+    api_key, instance = await asyncio.gather(
+        _create_api_key(api_client, auth_user, test_organization),
+        _create_redis_instance(api_client, auth_user, test_organization),
+    )
+    yield api_key, instance
+    
+    # Best effort: a failed delete (e.g. no cluster in development) must not fail the run
+    try:
+        await api_client.delete(
+            f"/api/organizations/{test_organization['id']}/redis-instances/{instance['id']}",
+            headers=auth_user["auth_headers"]
+        )
+    except httpx.HTTPError:
+        pass
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_api_key(test_resources):
+    """Return the session test API key data."""
+    return test_resources[0]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_redis_instance(test_resources):
+    """Return the session test Redis instance data."""
+    return test_resources[1]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def redis_client(test_api_key: Dict[str, Any]) -> AsyncGenerator[ApiClient, None]:
+    """Provide a client that sends the session API key on every request.
+    
+    The bearer header is built once and set as a client default, so Redis HTTP
+    API calls need no per-request ``headers``; use ``get_noauth`` to drop it.
+    """
+    client = ApiClient(BASE_URL, headers={"Authorization": f"Bearer {test_api_key['key']}"})
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def redis_key_cleanup(redis_client: ApiClient, test_redis_instance: Dict[str, Any]):
+    """Delete the keys this worker wrote once its Redis tests are done.
+    
+    Every generated key embeds this process's ``_PREFIX``, so one KEYS match
+    and one UNLINK remove them all without touching other workers' keys (a
+    FLUSHDB would, since all instances share the development Redis).
+    """
+    yield
+    command_url = f"/redis/{test_redis_instance['id']}"
+    response = await redis_client.post(command_url, json=["KEYS", f"*{_PREFIX}*"])
+    keys = jload(response).get("result") if response.status_code == 200 else None
+    if keys:
+        await redis_client.post(command_url, json=["UNLINK", *keys])
+
+
+def json_body(payload: Mapping[str, Any]) -> bytes:
+    """Encode a constant request payload once, to be sent with ``content=`` and JSON_HEADERS."""
+    return _json_dumps(dict(payload))
+
+
+@pytest.fixture
+def test_key() -> str:
+    """Provide one unique suffix per test for names that must not collide."""
+    return _uniq()
+
+
+def unique_slug(prefix: str) -> str:
+    """Generate a unique, slug-safe identifier (lowercase letters, digits, hyphens)."""
+    return f"{prefix}-{_uniq()}"
 
 
 def generate_test_key(prefix: str = "test") -> str:
     """Generate a unique test key."""
-    return f"{prefix}_{uuid4().hex[:8]}"
+    return f"{prefix}_{_uniq()}"
 
 
 def generate_test_value() -> str:
     """Generate a test value."""
-    return f"value_{uuid4().hex[:8]}"
\ No newline at end of file
+    return f"value_{_uniq()}"
\ No newline at end of file
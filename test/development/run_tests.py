@@ -23,16 +23,31 @@ Examples:
     # Run tests with verbose output
     python run_tests.py -v
 
+    # Run tests serially (parallel workers are used by default)
+    python run_tests.py -n 1
+
     # Install dependencies and run tests
     python run_tests.py --install-deps
 
     # Run tests and generate HTML report
     python run_tests.py --report
+
+    # Reuse the cached test user token from a previous run
+    python run_tests.py --use-token-cache
+
+    # Rerun only the tests that failed on the previous run
+    python run_tests.py --lf
+
+    # Also run the latency benchmarks (ping burst p99)
+    python run_tests.py --benchmark
 """
 
 import argparse
 import asyncio
+import functools
+import importlib.metadata
 import os
+import shutil
 import subprocess
 import sys
 import time
@@ -53,10 +68,18 @@ except ImportError:
     console = Console()
 
 if RICH_AVAILABLE:
-    console = Console()
+    # Plain output (no ANSI styling) when not attached to a terminal, e.g. in CI
+    IS_TTY = sys.stdout.isatty()
+    console = Console(force_terminal=IS_TTY, no_color=not IS_TTY, highlight=False)
 else:
     console = Console()
 
+# Packages the test suite cannot run without
+REQUIRED_PACKAGES = ("pytest", "httpx")
+
+# Seconds to wait for the server health check to succeed
+SERVER_WAIT_TIMEOUT = 30
+
 
 class TestRunner:
     """Main test runner for RedisGate development test suite."""
@@ -67,6 +90,29 @@ class TestRunner:
         self.project_root = self.test_dir.parent.parent
         self.venv_dir = self.test_dir / ".venv"
         self.results = {}
+        self._deps_ok = False
+        
+        # Resolve virtual environment executables once
+        bin_dir, exe_suffix = ("Scripts", ".exe") if os.name == 'nt' else ("bin", "")
+        self.venv_python = self.venv_dir / bin_dir / f"python{exe_suffix}"
+        self.venv_pip = self.venv_dir / bin_dir / f"pip{exe_suffix}"
+        
+        # Environment for the pytest subprocess (tests only run after
+        # _wait_for_server succeeded, so the fixtures can skip their probe)
+        self._test_env = {
+            **os.environ,
+            "PYTHONPATH": str(self.test_dir),
+            "REDISGATE_TEST_HOST": self.args.host,
+            "REDISGATE_TEST_PORT": str(self.args.port),
+            "REDISGATE_TEST_SERVER_READY": "1",
+        }
+    
+    @property
+    def python_cmd(self):
+        """Python executable to run tests with (venv if present, else system)."""
+        if self.venv_dir.exists():
+            return self.venv_python
+        return shutil.which("python3") or sys.executable
     
     def run_tests(self) -> bool:
         """Run the development test suite based on the selected options."""
@@ -104,27 +150,31 @@ class TestRunner:
         
         import httpx
         
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            try:
-                with httpx.Client() as client:
-                    response = client.get(f"http://{self.args.host}:{self.args.port}/health", timeout=5.0)
+        base_url = f"http://{self.args.host}:{self.args.port}"
+        deadline = time.monotonic() + SERVER_WAIT_TIMEOUT
+        attempt = 0
+        with httpx.Client(base_url=base_url, timeout=5.0) as client:
+            while True:
+                try:
+                    response = client.get("/health")
                     if response.status_code == 200:
-                        console.print(f"[green]✓ Server is ready at http://{self.args.host}:{self.args.port}[/green]")
+                        console.print(f"[green]✓ Server is ready at {base_url}[/green]")
                         return True
-            except (httpx.ConnectError, httpx.TimeoutException):
-                if attempt < max_attempts - 1:
-                    console.print(f"[yellow]Waiting for server... (attempt {attempt + 1}/{max_attempts})[/yellow]")
-                    time.sleep(2)
-                else:
-                    console.print(f"[red]✗ Server not available at http://{self.args.host}:{self.args.port}[/red]")
+                except (httpx.ConnectError, httpx.TimeoutException):
+                    pass
+                
+                if time.monotonic() >= deadline:
+                    console.print(f"[red]✗ Server not available at {base_url}[/red]")
                     console.print("[yellow]Please make sure the RedisGate server is running:[/yellow]")
                     console.print("  1. Run: cargo build")
                     console.print("  2. Run: cargo run")
                     console.print("  3. Wait for server to start on port 8080")
                     return False
-        
-        return False
+                if attempt % 5 == 0:
+                    console.print(f"[yellow]Waiting for server... (attempt {attempt + 1})[/yellow]")
+                # Exponential backoff: 50 ms, 100 ms, 200 ms, ... capped at 500 ms
+                time.sleep(min(0.5, 0.05 * 2 ** min(attempt, 4)))
+                attempt += 1
     
     def _install_dependencies(self) -> bool:
         """Install Python dependencies in a virtual environment."""
@@ -138,25 +188,18 @@ class TestRunner:
                     sys.executable, "-m", "venv", str(self.venv_dir)
                 ], check=True, cwd=self.test_dir)
             
-            # Determine python executable in venv
-            if os.name == 'nt':
-                python_cmd = self.venv_dir / "Scripts" / "python.exe"
-                pip_cmd = self.venv_dir / "Scripts" / "pip.exe"
-            else:
-                python_cmd = self.venv_dir / "bin" / "python"
-                pip_cmd = self.venv_dir / "bin" / "pip"
-            
             # Upgrade pip
             subprocess.run([
-                str(pip_cmd), "install", "--upgrade", "pip"
+                str(self.venv_pip), "install", "--upgrade", "pip"
             ], check=True, cwd=self.test_dir)
             
             # Install requirements
             subprocess.run([
-                str(pip_cmd), "install", "-r", "requirements.txt"
+                str(self.venv_pip), "install", "-r", "requirements.txt"
             ], check=True, cwd=self.test_dir)
             
             console.print("[green]✓ Dependencies installed successfully[/green]")
+            self._deps_ok = True
             return True
             
         except subprocess.CalledProcessError as e:
@@ -167,19 +210,28 @@ class TestRunner:
         """Check if required dependencies are available."""
         console.print("[blue]Checking dependencies...[/blue]")
         
-        # Determine python executable
-        if self.venv_dir.exists():
-            if os.name == 'nt':
-                python_cmd = self.venv_dir / "Scripts" / "python.exe"
-            else:
-                python_cmd = self.venv_dir / "bin" / "python"
-        else:
-            python_cmd = "python3"
+        # Fresh install already verified the environment
+        if self._deps_ok:
+            console.print("[green]✓ Dependencies are available[/green]")
+            return True
+        
+        # Same interpreter as this script: check installed distributions in-process
+        if os.path.realpath(self.python_cmd) == os.path.realpath(sys.executable):
+            try:
+                for package in REQUIRED_PACKAGES:
+                    importlib.metadata.distribution(package)
+            except importlib.metadata.PackageNotFoundError as e:
+                console.print(f"[red]✗ Required dependency not found: {e.name}[/red]")
+                console.print("Run with --install-deps to install them automatically")
+                return False
+            
+            console.print("[green]✓ Dependencies are available[/green]")
+            return True
         
-        # Check if pytest is available
+        # Check if pytest is available in the other interpreter
         try:
             result = subprocess.run([
-                str(python_cmd), "-c", "import pytest; import httpx; print('OK')"
+                str(self.python_cmd), "-c", "; ".join(f"import {p}" for p in REQUIRED_PACKAGES)
             ], capture_output=True, text=True, cwd=self.test_dir)
             
             if result.returncode != 0:
@@ -198,33 +250,17 @@ class TestRunner:
         """Execute the tests using pytest."""
         console.print("[blue]Running development tests...[/blue]")
         
-        # Determine python executable
-        if self.venv_dir.exists():
-            if os.name == 'nt':
-                python_cmd = self.venv_dir / "Scripts" / "python.exe"
-            else:
-                python_cmd = self.venv_dir / "bin" / "python"
-        else:
-            python_cmd = "python3"
-        
         # Build pytest command
-        pytest_args = self._build_pytest_args()
-        cmd = [str(python_cmd), "-m", "pytest"] + pytest_args
+        cmd = [str(self.python_cmd), "-m", "pytest"] + self.pytest_args
         
         console.print(f"[green]Running: {' '.join(cmd)}[/green]")
         
-        # Set environment
-        env = os.environ.copy()
-        env["PYTHONPATH"] = str(self.test_dir)
-        env["REDISGATE_TEST_HOST"] = self.args.host
-        env["REDISGATE_TEST_PORT"] = str(self.args.port)
-        
         # Run tests
         try:
             result = subprocess.run(
                 cmd,
                 cwd=self.test_dir,
-                env=env,
+                env=self._test_env,
                 timeout=self.args.timeout
             )
             
@@ -242,8 +278,9 @@ class TestRunner:
             console.print("[yellow]Tests interrupted by user[/yellow]")
             return False
     
-    def _build_pytest_args(self) -> List[str]:
-        """Build pytest command line arguments."""
+    @functools.cached_property
+    def pytest_args(self) -> List[str]:
+        """Pytest command line arguments (built once per runner)."""
         args = []
         
         # Test selection by marker
@@ -260,9 +297,28 @@ class TestRunner:
         if self.args.capture == "no":
             args.append("-s")
         
-        # Parallel execution
-        if self.args.workers and self.args.workers > 1:
-            args.extend(["-n", str(self.args.workers)])
+        # Reuse cached JWT for the test user
+        if self.args.use_token_cache:
+            args.append("--use-token-cache")
+        
+        # Run the latency benchmarks
+        if self.args.benchmark:
+            args.append("--benchmark")
+        
+        # Rerun selection from the pytest cache (iterative development loop)
+        if self.args.last_failed:
+            args.append("--lf")
+        if self.args.failed_first:
+            args.append("--ff")
+        if self.args.stepwise:
+            args.append("--sw")
+        
+        # Parallel execution (tests are grouped per worker with xdist_group so
+        # session fixtures are reused; stepwise mode needs a single ordered session)
+        if self.args.workers and self.args.workers > 1 and not self.args.stepwise:
+            args.extend(["-n", str(self.args.workers), "--dist=loadgroup"])
+        else:
+            args.extend(["-n", "0"])  # Override "-n auto" from pytest.ini
         
         # Test file selection
         if self.args.test_files:
@@ -337,10 +393,20 @@ def parse_args():
                        help="Verbose output")
     parser.add_argument("-s", "--capture", choices=["yes", "no"], default="yes",
                        help="Capture output (default: yes)")
-    parser.add_argument("-n", "--workers", type=int, default=1,
-                       help="Number of parallel test workers")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1,
+                       help="Number of parallel test workers (default: CPU count, 1 disables xdist)")
     parser.add_argument("--timeout", type=int, default=300,
                        help="Test timeout in seconds (default: 300)")
+    parser.add_argument("--lf", "--last-failed", dest="last_failed", action="store_true",
+                       help="Rerun only the tests that failed last time")
+    parser.add_argument("--ff", "--failed-first", dest="failed_first", action="store_true",
+                       help="Run previously failed tests first, then the rest")
+    parser.add_argument("--sw", "--stepwise", dest="stepwise", action="store_true",
+                       help="Stop at the first failure and resume from it next run (runs serially)")
+    parser.add_argument("--use-token-cache", action="store_true",
+                       help="Reuse the cached test user JWT across runs (.cache/tokens.json)")
+    parser.add_argument("--benchmark", action="store_true",
+                       help="Also run the latency benchmarks, such as the ping burst p99")
     
     # Dependencies and setup
     parser.add_argument("--install-deps", action="store_true",
@@ -7,96 +7,94 @@ This module tests:
 - JWT token validation
 """
 
+from types import MappingProxyType
+from typing import Any, Dict
+
 import pytest
-from uuid import uuid4
-from conftest import ApiClient, generate_test_key
+from conftest import ApiClient, JSON_HEADERS, TEST_PASSWORD, expect, json_body
+
+# Keep this module on one xdist worker so it reuses that worker's session fixtures
+pytestmark = pytest.mark.xdist_group("auth")
+
+# Constant request payloads (read-only; copy with {**PAYLOAD} before mutating)
+INVALID_LOGIN = MappingProxyType({
+    "email": "nonexistent@example.com",
+    "password": "wrongpassword"
+})
+INVALID_MISSING_FIELDS = MappingProxyType({
+    "username": "testuser"
+    # Missing email and password
+})
+INVALID_EMAIL = MappingProxyType({
+    "username": "testuser",
+    "email": "invalid-email",
+    "password": TEST_PASSWORD
+})
+INVALID_WEAK_PASSWORD = MappingProxyType({
+    "username": "testuser",
+    "email": "test@example.com",
+    "password": "123"  # Too weak
+})
+
+# Pre-encoded request bodies for the constant payloads above
+INVALID_LOGIN_BODY = json_body(INVALID_LOGIN)
+INVALID_MISSING_FIELDS_BODY = json_body(INVALID_MISSING_FIELDS)
+INVALID_EMAIL_BODY = json_body(INVALID_EMAIL)
+INVALID_WEAK_PASSWORD_BODY = json_body(INVALID_WEAK_PASSWORD)
 
 
 class TestAuthentication:
     """Test authentication related endpoints."""
     
     @pytest.mark.auth
-    async def test_user_registration(self, api_client: ApiClient, wait_for_server):
+    async def test_user_registration(self, api_client: ApiClient, test_key: str, wait_for_server):
         """Test user registration."""
-        username = f"testuser_{generate_test_key()}"
+        username = f"testuser_{test_key}"
         email = f"{username}@example.com"
-        password = "TestPassword123!"
         
         register_data = {
             "username": username,
             "email": email,
-            "password": password
+            "password": TEST_PASSWORD
         }
         
         response = await api_client.post("/auth/register", json=register_data)
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["success"] == True
         assert data["data"]["username"] == username
         assert data["data"]["email"] == email
         assert "id" in data["data"]
     
     @pytest.mark.auth
-    async def test_user_registration_duplicate_email(self, api_client: ApiClient, wait_for_server):
+    async def test_user_registration_duplicate_email(self, api_client: ApiClient, auth_user: Dict[str, Any], test_key: str, wait_for_server):
         """Test registration with duplicate email fails."""
-        username = f"testuser_{generate_test_key()}"
-        email = f"{username}@example.com"
-        password = "TestPassword123!"
-        
+        # The session user is already registered, so reuse its email
         register_data = {
-            "username": username,
-            "email": email,
-            "password": password
+            "username": f"testuser2_{test_key}",
+            "email": auth_user["email"],  # Same email
+            "password": TEST_PASSWORD
         }
         
-        # First registration should succeed
-        response1 = await api_client.post("/auth/register", json=register_data)
-        assert response1.status_code == 200
-        
-        # Second registration with same email should fail
-        username2 = f"testuser2_{generate_test_key()}"
-        register_data2 = {
-            "username": username2,
-            "email": email,  # Same email
-            "password": password
-        }
-        
-        response2 = await api_client.post("/auth/register", json=register_data2)
-        assert response2.status_code == 409
-        error_data = response2.json()
+        response = await api_client.post("/auth/register", json=register_data)
+        error_data = expect(response, 409)
         assert error_data["success"] == False
     
     @pytest.mark.auth
-    async def test_user_login(self, api_client: ApiClient, wait_for_server):
+    async def test_user_login(self, api_client: ApiClient, auth_user: Dict[str, Any], wait_for_server):
         """Test user login."""
-        username = f"testuser_{generate_test_key()}"
-        email = f"{username}@example.com"
-        password = "TestPassword123!"
-        
-        # First register a user
-        register_data = {
-            "username": username,
-            "email": email,
-            "password": password
-        }
-        
-        register_response = await api_client.post("/auth/register", json=register_data)
-        assert register_response.status_code == 200
-        
-        # Then login
+        # Log in as the session user instead of registering a new one
         login_data = {
-            "email": email,
-            "password": password
+            "email": auth_user["email"],
+            "password": TEST_PASSWORD
         }
         
         login_response = await api_client.post("/auth/login", json=login_data)
         
-        assert login_response.status_code == 200
-        data = login_response.json()
+        data = expect(login_response, 200)
         assert data["success"] == True
-        assert data["data"]["user"]["username"] == username
-        assert data["data"]["user"]["email"] == email
+        assert data["data"]["user"]["username"] == auth_user["username"]
+        assert data["data"]["user"]["email"] == auth_user["email"]
         assert "id" in data["data"]["user"]
         assert "token" in data["data"]
         assert isinstance(data["data"]["token"], str)
@@ -105,45 +103,18 @@ class TestAuthentication:
     @pytest.mark.auth
     async def test_user_login_invalid_credentials(self, api_client: ApiClient, wait_for_server):
         """Test login with invalid credentials fails."""
-        login_data = {
-            "email": "nonexistent@example.com",
-            "password": "wrongpassword"
-        }
-        
-        response = await api_client.post("/auth/login", json=login_data)
+        response = await api_client.post("/auth/login", content=INVALID_LOGIN_BODY, headers=JSON_HEADERS)
         
-        assert response.status_code == 401
-        error_data = response.json()
+        error_data = expect(response, 401)
         assert error_data["success"] == False
     
     @pytest.mark.auth
-    async def test_user_registration_invalid_data(self, api_client: ApiClient, wait_for_server):
+    @pytest.mark.parametrize("body, expected_statuses", [
+        (INVALID_MISSING_FIELDS_BODY, (422,)),
+        (INVALID_EMAIL_BODY, (400, 422)),  # Either is acceptable for validation errors
+        (INVALID_WEAK_PASSWORD_BODY, (400, 422)),
+    ], ids=["missing-fields", "invalid-email", "weak-password"])
+    async def test_user_registration_invalid_data(self, api_client: ApiClient, body, expected_statuses, wait_for_server):
         """Test registration with invalid data fails."""
-        # Test missing required fields
-        invalid_data = {
-            "username": "testuser"
-            # Missing email and password
-        }
-        
-        response = await api_client.post("/auth/register", json=invalid_data)
-        assert response.status_code == 422
-        
-        # Test invalid email format
-        invalid_email_data = {
-            "username": "testuser",
-            "email": "invalid-email",
-            "password": "TestPassword123!"
-        }
-        
-        response = await api_client.post("/auth/register", json=invalid_email_data)
-        assert response.status_code in [400, 422]  # Either is acceptable for validation errors
-        
-        # Test weak password
-        weak_password_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "123"  # Too weak
-        }
-        
-        response = await api_client.post("/auth/register", json=weak_password_data)
-        assert response.status_code in [400, 422]  # Either is acceptable for validation errors
\ No newline at end of file
+        response = await api_client.post("/auth/register", content=body, headers=JSON_HEADERS)
+        assert response.status_code in expected_statuses
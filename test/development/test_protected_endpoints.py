@@ -7,33 +7,54 @@ This module tests:
 - Redis instance management endpoints
 """
 
+import asyncio
 import pytest
-import time
 from uuid import uuid4
 from typing import Dict, Any
-from conftest import ApiClient, generate_test_key
+from conftest import ApiClient, JSON_HEADERS, expect, json_body, unique_slug
 
+# Unauthenticated probes: (method, url, pre-encoded body) against a random organization
+FAKE_ORG_ID = str(uuid4())
+UNAUTHORIZED_CREATE_BODY = json_body({"name": "test"})
+UNAUTHORIZED_API_KEY_BODY = json_body({
+    "name": "test",
+    "organization_id": FAKE_ORG_ID,
+    "scopes": ["read"]  # Changed from permissions to scopes
+})
+UNAUTHORIZED_CASES = (
+    ("GET", "/api/organizations", None),
+    ("POST", "/api/organizations", UNAUTHORIZED_CREATE_BODY),
+    ("GET", f"/api/organizations/{FAKE_ORG_ID}/api-keys", None),
+    ("POST", f"/api/organizations/{FAKE_ORG_ID}/api-keys", UNAUTHORIZED_API_KEY_BODY),
+    ("GET", f"/api/organizations/{FAKE_ORG_ID}/redis-instances", None),
+    ("POST", f"/api/organizations/{FAKE_ORG_ID}/redis-instances", UNAUTHORIZED_CREATE_BODY),
+)
 
+# Keep this module on one xdist worker so it reuses that worker's session fixtures
+pytestmark = pytest.mark.xdist_group("protected")
+
+
+@pytest.mark.xdist_group("org_readonly")
 class TestOrganizations:
-    """Test organization management endpoints."""
+    """Test organization management endpoints that don't modify the shared organization."""
     
     @pytest.mark.protected
-    async def test_create_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], wait_for_server):
+    async def test_create_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], test_key: str, wait_for_server):
         """Test creating an organization."""
+        headers = auth_user["auth_headers"]
         org_data = {
-            "name": f"Test Organization {generate_test_key()}",
-            "slug": f"test-org-{int(time.time() * 1000000)}",
+            "name": f"Test Organization {test_key}",
+            "slug": unique_slug("test-org"),
             "description": "Test organization for development testing"
         }
         
         response = await api_client.post(
             "/api/organizations",
             json=org_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["success"] == True
         assert data["data"]["name"] == org_data["name"]
         assert data["data"]["description"] == org_data["description"]
@@ -45,13 +66,13 @@ class TestOrganizations:
     @pytest.mark.protected
     async def test_list_organizations(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
         """Test listing organizations."""
+        headers = auth_user["auth_headers"]
         response = await api_client.get(
             "/api/organizations",
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["success"] == True
         assert isinstance(data["data"]["items"], list)
         assert len(data["data"]["items"]) >= 1
@@ -63,73 +84,82 @@ class TestOrganizations:
     @pytest.mark.protected
     async def test_get_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
         """Test getting a specific organization."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         response = await api_client.get(
             f"/api/organizations/{org_id}",
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["success"] == True
         assert data["data"]["id"] == org_id
         assert data["data"]["name"] == test_organization["name"]
         assert data["data"]["description"] == test_organization["description"]
+
+
+@pytest.mark.xdist_group("org_mutations")
+class TestOrganizationMutations:
+    """Test organization endpoints that modify or delete organizations.
+    
+    These only touch organizations of their own, so they can be scheduled
+    independently of the read-only tests above.
+    """
     
     @pytest.mark.protected
-    async def test_update_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
+    async def test_update_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], mutable_organization: Dict[str, Any], test_key: str, wait_for_server):
         """Test updating an organization."""
-        org_id = test_organization["id"]
+        headers = auth_user["auth_headers"]
+        org_id = mutable_organization["id"]
         
         update_data = {
-            "name": f"Updated Organization {generate_test_key()}",
-            "slug": f"updated-org-{int(time.time() * 1000000)}",
+            "name": f"Updated Organization {test_key}",
+            "slug": unique_slug("updated-org"),
             "description": "Updated description"
         }
         
         response = await api_client.put(
             f"/api/organizations/{org_id}",
             json=update_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["success"] == True
         assert data["data"]["name"] == update_data["name"]
         assert data["data"]["description"] == update_data["description"]
     
     @pytest.mark.protected
-    async def test_delete_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], wait_for_server):
+    async def test_delete_organization(self, api_client: ApiClient, auth_user: Dict[str, Any], test_key: str, wait_for_server):
         """Test deleting an organization."""
+        headers = auth_user["auth_headers"]
         # Create a temporary organization for deletion
         org_data = {
-            "name": f"Temp Organization {generate_test_key()}",
-            "slug": f"temp-org-{int(time.time() * 1000000)}",
+            "name": f"Temp Organization {test_key}",
+            "slug": unique_slug("temp-org"),
             "description": "Temporary organization for deletion test"
         }
         
         create_response = await api_client.post(
             "/api/organizations",
             json=org_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
-        assert create_response.status_code == 200
-        temp_org = create_response.json()["data"]
+        temp_org_id = expect(create_response, 200)["data"]["id"]
         
         # Delete the organization
         delete_response = await api_client.delete(
-            f"/api/organizations/{temp_org['id']}",
-            headers=auth_user["auth_headers"]
+            f"/api/organizations/{temp_org_id}",
+            headers=headers
         )
         
         assert delete_response.status_code == 200  # API returns 200, not 204
         
-        # Verify it's deleted by trying to get it
-        get_response = await api_client.get(
-            f"/api/organizations/{temp_org['id']}",
-            headers=auth_user["auth_headers"]
+        # Verify it's deleted (HEAD is served by the GET route, without a body)
+        get_response = await api_client.head(
+            f"/api/organizations/{temp_org_id}",
+            headers=headers
         )
         assert get_response.status_code == 404
 
@@ -138,12 +168,13 @@ class TestApiKeys:
     """Test API key management endpoints."""
     
     @pytest.mark.protected
-    async def test_create_api_key(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
+    async def test_create_api_key(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_key: str, wait_for_server):
         """Test creating an API key with JWT tokens."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         api_key_data = {
-            "name": f"Test API Key {generate_test_key()}",
+            "name": f"Test API Key {test_key}",
             "organization_id": org_id,
             "scopes": ["read", "write"]  # Changed from permissions to scopes
         }
@@ -151,11 +182,10 @@ class TestApiKeys:
         response = await api_client.post(
             f"/api/organizations/{org_id}/api-keys",
             json=api_key_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200  # Changed from 201 to 200
-        data = response.json()["data"]  # Response is wrapped in ApiResponse
+        data = expect(response, 200)["data"]  # Response is wrapped in ApiResponse
         
         # Test the new JWT-based response structure
         assert "api_key" in data
@@ -179,15 +209,15 @@ class TestApiKeys:
     @pytest.mark.protected
     async def test_list_api_keys(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
         """Test listing API keys."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         response = await api_client.get(
             f"/api/organizations/{org_id}/api-keys",
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()["data"]  # Response is wrapped in ApiResponse
+        data = expect(response, 200)["data"]  # Response is wrapped in ApiResponse
         assert "items" in data  # Paginated response
         assert isinstance(data["items"], list)
         assert len(data["items"]) >= 1
@@ -199,29 +229,30 @@ class TestApiKeys:
     @pytest.mark.protected
     async def test_get_api_key(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
         """Test getting a specific API key."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         key_id = test_api_key["id"]
         
         response = await api_client.get(
             f"/api/organizations/{org_id}/api-keys/{key_id}",
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()["data"]  # Response is wrapped in ApiResponse
+        data = expect(response, 200)["data"]  # Response is wrapped in ApiResponse
         assert data["id"] == key_id
         assert data["name"] == test_api_key["name"]
         assert data["organization_id"] == org_id
         assert "scopes" in data  # Changed from permissions to scopes
     
     @pytest.mark.protected
-    async def test_revoke_api_key(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
+    async def test_revoke_api_key(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_key: str, wait_for_server):
         """Test revoking an API key."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         # Create a temporary API key for revocation
         api_key_data = {
-            "name": f"Temp API Key {generate_test_key()}",
+            "name": f"Temp API Key {test_key}",
             "organization_id": org_id,
             "scopes": ["read"]  # Changed from permissions to scopes
         }
@@ -229,23 +260,22 @@ class TestApiKeys:
         create_response = await api_client.post(
             f"/api/organizations/{org_id}/api-keys",
             json=api_key_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
-        assert create_response.status_code == 200  # Changed from 201 to 200
-        temp_key = create_response.json()["data"]["api_key"]  # Updated response structure
+        temp_key_id = expect(create_response, 200)["data"]["api_key"]["id"]  # Updated response structure
         
         # Revoke the API key
         revoke_response = await api_client.delete(
-            f"/api/organizations/{org_id}/api-keys/{temp_key['id']}",
-            headers=auth_user["auth_headers"]
+            f"/api/organizations/{org_id}/api-keys/{temp_key_id}",
+            headers=headers
         )
         
         assert revoke_response.status_code == 200  # Changed from 204 to 200
         
-        # Verify it's revoked by trying to get it (should return 404 since it's inactive)
-        get_response = await api_client.get(
-            f"/api/organizations/{org_id}/api-keys/{temp_key['id']}",
-            headers=auth_user["auth_headers"]
+        # Verify it's revoked; HEAD runs the GET route without a body (404 since it's inactive)
+        get_response = await api_client.head(
+            f"/api/organizations/{org_id}/api-keys/{temp_key_id}",
+            headers=headers
         )
         assert get_response.status_code == 404
 
@@ -254,12 +284,13 @@ class TestRedisInstances:
     """Test Redis instance management endpoints."""
     
     @pytest.mark.protected
-    async def test_create_redis_instance(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
+    async def test_create_redis_instance(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_key: str, wait_for_server):
         """Test creating a Redis instance."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         instance_data = {
-            "name": f"Test Redis Instance {generate_test_key()}",
+            "name": f"Test Redis Instance {test_key}",
             "redis_url": "redis://localhost:6379/0",
             "port": 6379,
             "database": 0,
@@ -269,11 +300,10 @@ class TestRedisInstances:
         response = await api_client.post(
             f"/api/organizations/{org_id}/redis-instances",
             json=instance_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 201
-        data = response.json()
+        data = expect(response, 201)
         assert data["name"] == instance_data["name"]
         assert data["redis_url"] == instance_data["redis_url"]
         assert data["port"] == instance_data["port"]
@@ -285,15 +315,15 @@ class TestRedisInstances:
     @pytest.mark.protected
     async def test_list_redis_instances(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_redis_instance: Dict[str, Any], wait_for_server):
         """Test listing Redis instances."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         response = await api_client.get(
             f"/api/organizations/{org_id}/redis-instances",
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert isinstance(data, list)
         assert len(data) >= 1
         
@@ -304,16 +334,16 @@ class TestRedisInstances:
     @pytest.mark.protected
     async def test_get_redis_instance(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_redis_instance: Dict[str, Any], wait_for_server):
         """Test getting a specific Redis instance."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         instance_id = test_redis_instance["id"]
         
         response = await api_client.get(
             f"/api/organizations/{org_id}/redis-instances/{instance_id}",
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["id"] == instance_id
         assert data["name"] == test_redis_instance["name"]
         assert data["organization_id"] == org_id
@@ -321,6 +351,7 @@ class TestRedisInstances:
     @pytest.mark.protected
     async def test_update_redis_instance_status(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_redis_instance: Dict[str, Any], wait_for_server):
         """Test updating Redis instance status."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         instance_id = test_redis_instance["id"]
         
@@ -331,21 +362,21 @@ class TestRedisInstances:
         response = await api_client.put(
             f"/api/organizations/{org_id}/redis-instances/{instance_id}/status",
             json=status_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["status"] == status_data["status"]
     
     @pytest.mark.protected
-    async def test_delete_redis_instance(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], wait_for_server):
+    async def test_delete_redis_instance(self, api_client: ApiClient, auth_user: Dict[str, Any], test_organization: Dict[str, Any], test_key: str, wait_for_server):
         """Test deleting a Redis instance."""
+        headers = auth_user["auth_headers"]
         org_id = test_organization["id"]
         
         # Create a temporary Redis instance for deletion
         instance_data = {
-            "name": f"Temp Redis Instance {generate_test_key()}",
+            "name": f"Temp Redis Instance {test_key}",
             "redis_url": "redis://localhost:6379/1",
             "port": 6379,
             "database": 1,
@@ -355,23 +386,22 @@ class TestRedisInstances:
         create_response = await api_client.post(
             f"/api/organizations/{org_id}/redis-instances",
             json=instance_data,
-            headers=auth_user["auth_headers"]
+            headers=headers
         )
-        assert create_response.status_code == 201
-        temp_instance = create_response.json()
+        temp_instance_id = expect(create_response, 201)["id"]
         
         # Delete the Redis instance
         delete_response = await api_client.delete(
-            f"/api/organizations/{org_id}/redis-instances/{temp_instance['id']}",
-            headers=auth_user["auth_headers"]
+            f"/api/organizations/{org_id}/redis-instances/{temp_instance_id}",
+            headers=headers
         )
         
         assert delete_response.status_code == 204
         
-        # Verify it's deleted by trying to get it
-        get_response = await api_client.get(
-            f"/api/organizations/{org_id}/redis-instances/{temp_instance['id']}",
-            headers=auth_user["auth_headers"]
+        # Verify it's deleted (HEAD is served by the GET route, without a body)
+        get_response = await api_client.head(
+            f"/api/organizations/{org_id}/redis-instances/{temp_instance_id}",
+            headers=headers
         )
         assert get_response.status_code == 404
 
@@ -380,40 +410,17 @@ class TestUnauthorizedAccess:
     """Test that protected endpoints require authentication."""
     
     @pytest.mark.protected
-    async def test_organizations_require_auth(self, api_client: ApiClient, wait_for_server):
-        """Test that organization endpoints require authentication."""
-        # Test without any headers
-        response = await api_client.get("/api/organizations")
-        assert response.status_code == 401
-        
-        response = await api_client.post("/api/organizations", json={"name": "test"})
-        assert response.status_code == 401
-    
-    @pytest.mark.protected
-    async def test_api_keys_require_auth(self, api_client: ApiClient, wait_for_server):
-        """Test that API key endpoints require authentication."""
-        fake_org_id = str(uuid4())
-        
-        response = await api_client.get(f"/api/organizations/{fake_org_id}/api-keys")
-        assert response.status_code == 401
-        
-        response = await api_client.post(
-            f"/api/organizations/{fake_org_id}/api-keys", 
-            json={
-                "name": "test",
-                "organization_id": fake_org_id,
-                "scopes": ["read"]  # Changed from permissions to scopes
-            }
-        )
-        assert response.status_code == 401
-    
-    @pytest.mark.protected
-    async def test_redis_instances_require_auth(self, api_client: ApiClient, wait_for_server):
-        """Test that Redis instance endpoints require authentication."""
-        fake_org_id = str(uuid4())
-        
-        response = await api_client.get(f"/api/organizations/{fake_org_id}/redis-instances")
-        assert response.status_code == 401
-        
-        response = await api_client.post(f"/api/organizations/{fake_org_id}/redis-instances", json={"name": "test"})
-        assert response.status_code == 401
\ No newline at end of file
+    async def test_endpoints_require_auth(self, api_client: ApiClient, wait_for_server):
+        """Test that organization, API key and Redis instance endpoints require authentication."""
+        # Test without any auth headers, all probes at once
+        responses = await asyncio.gather(*[
+            api_client.request(method, url, content=body, headers=JSON_HEADERS if body else None)
+            for method, url, body in UNAUTHORIZED_CASES
+        ])
+        
+        failures = [
+            f"{method} {url} -> {response.status_code}"
+            for (method, url, _), response in zip(UNAUTHORIZED_CASES, responses)
+            if response.status_code != 401
+        ]
+        assert not failures, f"Endpoints accessible without auth: {failures}"
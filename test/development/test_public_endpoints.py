@@ -8,7 +8,10 @@ This module tests:
 """
 
 import pytest
-from conftest import ApiClient
+from conftest import ApiClient, expect
+
+# Keep this module on one xdist worker so it reuses that worker's session fixtures
+pytestmark = pytest.mark.xdist_group("public")
 
 
 class TestPublicEndpoints:
@@ -19,8 +22,7 @@ class TestPublicEndpoints:
         """Test the health check endpoint."""
         response = await api_client.get("/health")
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["status"] == "ok"
         assert "timestamp" in data
         assert data["database"] == "healthy"
@@ -30,8 +32,7 @@ class TestPublicEndpoints:
         """Test the version endpoint."""
         response = await api_client.get("/version")
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert "version" in data
         assert "name" in data
         assert "description" in data
@@ -42,8 +43,7 @@ class TestPublicEndpoints:
         """Test the database statistics endpoint."""
         response = await api_client.get("/stats")
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert "tables" in data
         assert "timestamp" in data
         assert isinstance(data["tables"], dict)
@@ -5,302 +5,268 @@ This module tests:
 - Basic Redis operations (PING, GET, SET, DEL, INCR)
 - Hash operations (HGET, HSET)
 - List operations (LPUSH, LPOP)
-- Generic command execution
+- Generic command execution (single commands and pipelines)
 - API key authentication
 """
 
+import asyncio
+import statistics
+import time
+
 import pytest
 from typing import Dict, Any
-from conftest import ApiClient, generate_test_key, generate_test_value
+from conftest import ApiClient, expect, generate_test_key, generate_test_value
+
+# No xdist_group here: every test uses its own generated key, so these tests are
+# spread over all workers; each worker gets its own session API key and Redis
+# instance (see conftest), so no instance is shared between processes.
+pytestmark = pytest.mark.usefixtures("redis_key_cleanup")
+
+
+# URL templates, filled per test from one url_args mapping with str.format_map
+PING_URL = "/redis/{id}/ping"
+SET_URL = "/redis/{id}/set/{key}/{value}"
+GET_URL = "/redis/{id}/get/{key}"
+DEL_URL = "/redis/{id}/del/{key}"
+INCR_URL = "/redis/{id}/incr/{key}"
+HSET_URL = "/redis/{id}/hset/{key}/{field}/{value}"
+HGET_URL = "/redis/{id}/hget/{key}/{field}"
+LPUSH_URL = "/redis/{id}/lpush/{key}/{value}"
+LPOP_URL = "/redis/{id}/lpop/{key}"
+COMMAND_URL = "/redis/{id}"
+DEBUG_URL = "/redis/{id}/debug/test"
+
+# Ping burst: total requests, requests in flight, and the p99 latency budget.
+# Pings re-send one API key, so they are served from the server's verify cache.
+# The budget is wall-clock dependent, so the burst only runs with --benchmark.
+PING_BURST = 1000
+PING_BURST_CONCURRENCY = 32
+PING_P99_BUDGET_MS = 250
+
+# Stands in for the generated value in expected results
+STORED_VALUE = object()
+
+# Command cases for the generic endpoint: (command template, expected "result")
+# steps run in order on one fresh key, so later steps see the effect of earlier ones
+COMMAND_CASES = [
+    pytest.param([(["PING"], "PONG")], id="ping"),
+    pytest.param([(["SET", "{key}", "{value}"], "OK"), (["GET", "{key}"], STORED_VALUE)], id="set-get"),
+    # DEL returns the number of keys deleted; GET then finds nothing
+    pytest.param([(["SET", "{key}", "{value}"], "OK"), (["DEL", "{key}"], 1), (["GET", "{key}"], None)], id="del"),
+    # INCR on a missing key starts from 0
+    pytest.param([(["INCR", "{key}"], 1), (["INCR", "{key}"], 2)], id="incr"),
+    # HSET returns the number of fields added
+    pytest.param([(["HSET", "{key}", "{field}", "{value}"], 1), (["HGET", "{key}", "{field}"], STORED_VALUE)], id="hset-hget"),
+    # LPUSH returns the list length after the push
+    pytest.param([(["LPUSH", "{key}", "{value}"], 1), (["LPOP", "{key}"], STORED_VALUE)], id="lpush-lpop"),
+]
+
+# Legacy path-style routes, each visited once: groups of (URL template, expected) steps,
+# every group on its own fresh key
+ROUTE_STEPS = [
+    [(PING_URL, "PONG")],
+    [(SET_URL, "OK"), (GET_URL, STORED_VALUE), (DEL_URL, 1)],
+    [(INCR_URL, 1)],
+    [(HSET_URL, 1), (HGET_URL, STORED_VALUE)],
+    [(LPUSH_URL, 1), (LPOP_URL, STORED_VALUE)],
+]
+
+
+def _command_args(test_redis_instance: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the per-step template arguments around a fresh key and value."""
+    return {
+        "id": test_redis_instance["id"],
+        "key": generate_test_key("test_command"),
+        "field": "test_field",
+        "value": generate_test_value(),
+    }
+
+
+async def _check_steps(send, steps, url_args: Dict[str, Any]) -> None:
+    """Send each step's target in order and check its "result"."""
+    for target, expected in steps:
+        response = await send(target)
+        
+        if expected is STORED_VALUE:
+            expected = url_args["value"]
+        assert expect(response, 200)["result"] == expected, target
 
 
 class TestRedisHttpApi:
     """Test Redis HTTP API endpoints."""
     
     @pytest.mark.redis
-    async def test_redis_ping(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
-        """Test Redis PING command."""
-        instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
+    @pytest.mark.parametrize("steps", COMMAND_CASES)
+    async def test_redis_command(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server, steps):
+        """Test commands through the generic POST endpoint, one step at a time."""
+        url_args = _command_args(test_redis_instance)
+        command_url = COMMAND_URL.format_map(url_args)
         
-        response = await api_client.get(
-            f"/redis/{instance_id}/ping",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
+        def send(command):
+            return redis_client.post(command_url, json=[part.format_map(url_args) for part in command])
         
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == "PONG"
+        await _check_steps(send, steps, url_args)
+    
+    @pytest.mark.redis
+    async def test_redis_path_routes(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
+        """Test each legacy path-style GET route once."""
+        for steps in ROUTE_STEPS:
+            url_args = _command_args(test_redis_instance)
+            await _check_steps(lambda template: redis_client.get(template.format_map(url_args)), steps, url_args)
     
     @pytest.mark.redis
-    async def test_redis_jwt_token_verification(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
+    @pytest.mark.slow
+    @pytest.mark.benchmark
+    async def test_redis_ping_burst(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
+        """Test that a burst of back-to-back pings all succeed within the p99 budget."""
+        ping_url = PING_URL.format_map({"id": test_redis_instance["id"]})
+        in_flight = asyncio.Semaphore(PING_BURST_CONCURRENCY)
+        
+        async def timed_ping():
+            async with in_flight:
+                start = time.perf_counter()
+                response = await redis_client.get(ping_url)
+                return response, (time.perf_counter() - start) * 1000
+        
+        results = await asyncio.gather(*(timed_ping() for _ in range(PING_BURST)))
+        
+        assert all(expect(response, 200)["result"] == "PONG" for response, _ in results)
+        p99 = statistics.quantiles([ms for _, ms in results], n=100)[98]
+        assert p99 < PING_P99_BUDGET_MS, f"p99 ping latency {p99:.1f} ms exceeds {PING_P99_BUDGET_MS} ms"
+    
+    @pytest.mark.redis
+    async def test_redis_jwt_token_verification(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
         """Test that JWT tokens work for Redis API authentication."""
         instance_id = test_redis_instance["id"]
         jwt_token = test_api_key["key"]
+        url_args = {"id": instance_id}
         
         # Verify the token is a JWT format (has 3 parts separated by dots)
         assert isinstance(jwt_token, str)
-        assert jwt_token.count('.') == 2, "API key should be a JWT token with 3 parts"
+        parts = jwt_token.split('.')
+        assert len(parts) == 3 and all(parts), "API key should be a JWT token with 3 parts"
         assert len(jwt_token) > 100, "JWT token should be reasonably long"
         
-        # Test that the JWT token works for Redis operations
-        response = await api_client.get(
-            f"/redis/{instance_id}/ping",
-            headers={"Authorization": f"Bearer {jwt_token}"}
+        # Test that the JWT token works as a bearer header and as a query
+        # parameter; the two pings are independent, so issue them together
+        response, response_query = await asyncio.gather(
+            redis_client.get(PING_URL.format_map(url_args)),
+            redis_client.get_noauth(
+                PING_URL.format_map(url_args),
+                params={"_token": jwt_token}
+            ),
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["result"] == "PONG"
         
-        # Test that JWT token works as query parameter too
-        response_query = await api_client.get(
-            f"/redis/{instance_id}/ping",
-            params={"_token": jwt_token}
-        )
-        
-        assert response_query.status_code == 200
-        query_data = response_query.json()
+        query_data = expect(response_query, 200)
         assert query_data["result"] == "PONG"
     
     @pytest.mark.redis
-    async def test_redis_set_get(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
-        """Test Redis SET and GET commands."""
-        instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
-        key = generate_test_key("test_set_get")
-        value = generate_test_value()
-        
-        # Test SET
-        set_response = await api_client.get(
-            f"/redis/{instance_id}/set/{key}/{value}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert set_response.status_code == 200
-        set_data = set_response.json()
-        assert set_data["result"] == "OK"
-        
-        # Test GET
-        get_response = await api_client.get(
-            f"/redis/{instance_id}/get/{key}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert get_response.status_code == 200
-        get_data = get_response.json()
-        assert get_data["result"] == value
-    
-    @pytest.mark.redis
-    async def test_redis_del(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
-        """Test Redis DEL command."""
-        instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
-        key = generate_test_key("test_del")
-        value = generate_test_value()
-        
-        # First set a value
-        await api_client.get(
-            f"/redis/{instance_id}/set/{key}/{value}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        # Then delete it
-        del_response = await api_client.get(
-            f"/redis/{instance_id}/del/{key}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert del_response.status_code == 200
-        del_data = del_response.json()
-        assert del_data["result"] == 1  # Number of keys deleted
-        
-        # Verify it's deleted
-        get_response = await api_client.get(
-            f"/redis/{instance_id}/get/{key}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert get_response.status_code == 200
-        get_data = get_response.json()
-        assert get_data["result"] is None
-    
-    @pytest.mark.redis
-    async def test_redis_incr(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
-        """Test Redis INCR command."""
-        instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
-        key = generate_test_key("test_incr")
-        
-        # Test INCR on non-existent key (should start from 0)
-        incr_response = await api_client.get(
-            f"/redis/{instance_id}/incr/{key}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert incr_response.status_code == 200
-        incr_data = incr_response.json()
-        assert incr_data["result"] == 1
-        
-        # Test INCR again
-        incr_response2 = await api_client.get(
-            f"/redis/{instance_id}/incr/{key}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert incr_response2.status_code == 200
-        incr_data2 = incr_response2.json()
-        assert incr_data2["result"] == 2
-    
-    @pytest.mark.redis
-    async def test_redis_hset_hget(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
-        """Test Redis HSET and HGET commands."""
-        instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
-        key = generate_test_key("test_hash")
-        field = "test_field"
-        value = generate_test_value()
-        
-        # Test HSET
-        hset_response = await api_client.get(
-            f"/redis/{instance_id}/hset/{key}/{field}/{value}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert hset_response.status_code == 200
-        hset_data = hset_response.json()
-        assert hset_data["result"] == 1  # Number of fields added
-        
-        # Test HGET
-        hget_response = await api_client.get(
-            f"/redis/{instance_id}/hget/{key}/{field}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert hget_response.status_code == 200
-        hget_data = hget_response.json()
-        assert hget_data["result"] == value
-    
-    @pytest.mark.redis
-    async def test_redis_lpush_lpop(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
-        """Test Redis LPUSH and LPOP commands."""
-        instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
-        key = generate_test_key("test_list")
-        value = generate_test_value()
-        
-        # Test LPUSH
-        lpush_response = await api_client.get(
-            f"/redis/{instance_id}/lpush/{key}/{value}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert lpush_response.status_code == 200
-        lpush_data = lpush_response.json()
-        assert lpush_data["result"] == 1  # Length of list after push
-        
-        # Test LPOP
-        lpop_response = await api_client.get(
-            f"/redis/{instance_id}/lpop/{key}",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
-        
-        assert lpop_response.status_code == 200
-        lpop_data = lpop_response.json()
-        assert lpop_data["result"] == value
-    
-    @pytest.mark.redis
-    async def test_redis_generic_command(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
+    async def test_redis_generic_command(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
         """Test generic Redis command execution via POST."""
         instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
         key = generate_test_key("test_generic")
         value = generate_test_value()
-        
-        # Test generic SET command
+        url_args = {"id": instance_id}
+        # Build both command bodies up front
         set_command = ["SET", key, value]
+        get_command = ["GET", key]
         
-        set_response = await api_client.post(
-            f"/redis/{instance_id}",
-            json=set_command,
-            headers={"Authorization": f"Bearer {api_key}"}
+        # Test generic SET command
+        set_response = await redis_client.post(
+            COMMAND_URL.format_map(url_args),
+            json=set_command
         )
         
-        assert set_response.status_code == 200
-        set_data = set_response.json()
+        set_data = expect(set_response, 200)
         assert set_data["result"] == "OK"
         
         # Test generic GET command
-        get_command = ["GET", key]
-        
-        get_response = await api_client.post(
-            f"/redis/{instance_id}",
-            json=get_command,
-            headers={"Authorization": f"Bearer {api_key}"}
+        get_response = await redis_client.post(
+            COMMAND_URL.format_map(url_args),
+            json=get_command
         )
         
-        assert get_response.status_code == 200
-        get_data = get_response.json()
+        get_data = expect(get_response, 200)
         assert get_data["result"] == value
     
     @pytest.mark.redis
-    async def test_redis_api_key_query_param(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
+    async def test_redis_pipeline(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
+        """Test a pipeline of commands sent in one generic POST request."""
+        instance_id = test_redis_instance["id"]
+        key = generate_test_key("test_pipeline")
+        counter_key = generate_test_key("test_pipeline_incr")
+        value = generate_test_value()
+        url_args = {"id": instance_id}
+        
+        # One request, one API key check, one Redis connection for all commands
+        pipeline = [
+            ["SET", key, value],
+            ["GET", key],
+            ["DEL", key],
+            ["GET", key],
+            ["INCR", counter_key],
+            ["INCR", counter_key],
+        ]
+        
+        response = await redis_client.post(COMMAND_URL.format_map(url_args), json=pipeline)
+        
+        data = expect(response, 200)
+        assert data["results"] == ["OK", value, 1, None, 1, 2]
+    
+    @pytest.mark.redis
+    async def test_redis_api_key_query_param(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
         """Test Redis API with API key as query parameter."""
         instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
+        url_args = {"id": instance_id}
         
-        response = await api_client.get(
-            f"/redis/{instance_id}/ping",
-            params={"_token": api_key}
+        response = await redis_client.get_noauth(
+            PING_URL.format_map(url_args),
+            params={"_token": test_api_key["key"]}
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert data["result"] == "PONG"
     
     @pytest.mark.redis
-    async def test_redis_unauthorized_access(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
+    async def test_redis_unauthorized_access(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
         """Test that Redis endpoints require API key authentication."""
         instance_id = test_redis_instance["id"]
-        
-        # Test without API key
-        response = await api_client.get(f"/redis/{instance_id}/ping")
-        assert response.status_code == 401
-        
-        # Test with invalid API key
-        response = await api_client.get(
-            f"/redis/{instance_id}/ping",
-            headers={"Authorization": "Bearer invalid_key"}
+        url_args = {"id": instance_id}
+        
+        # Without an API key and with an invalid one (independent requests)
+        no_key_response, bad_key_response = await asyncio.gather(
+            redis_client.get_noauth(PING_URL.format_map(url_args)),
+            redis_client.get(
+                PING_URL.format_map(url_args),
+                headers={"Authorization": "Bearer invalid_key"}
+            ),
         )
-        assert response.status_code == 401
+        assert no_key_response.status_code == 401
+        assert bad_key_response.status_code == 401
     
     @pytest.mark.redis
-    async def test_redis_nonexistent_instance(self, api_client: ApiClient, test_api_key: Dict[str, Any], wait_for_server):
+    async def test_redis_nonexistent_instance(self, redis_client: ApiClient, wait_for_server):
         """Test Redis operations with non-existent instance ID."""
         fake_instance_id = "00000000-0000-0000-0000-000000000000"
-        api_key = test_api_key["key"]
+        url_args = {"id": fake_instance_id}
         
-        response = await api_client.get(
-            f"/redis/{fake_instance_id}/ping",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
+        response = await redis_client.get(PING_URL.format_map(url_args))
         
         assert response.status_code == 404
     
     @pytest.mark.redis
-    async def test_redis_debug_endpoint(self, api_client: ApiClient, test_redis_instance: Dict[str, Any], test_api_key: Dict[str, Any], wait_for_server):
+    async def test_redis_debug_endpoint(self, redis_client: ApiClient, test_redis_instance: Dict[str, Any], wait_for_server):
         """Test Redis debug endpoint."""
         instance_id = test_redis_instance["id"]
-        api_key = test_api_key["key"]
+        url_args = {"id": instance_id}
         
-        response = await api_client.get(
-            f"/redis/{instance_id}/debug/test",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
+        response = await redis_client.get(DEBUG_URL.format_map(url_args))
         
         # Debug endpoint should return information about the request
-        assert response.status_code == 200
-        data = response.json()
+        data = expect(response, 200)
         assert "method" in data
         assert "path" in data
         assert "instance_id" in data
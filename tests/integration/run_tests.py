@@ -12,30 +12,38 @@ Options:
     --mode MODE           Test mode: basic, advanced, all, ci, benchmark
     --host HOST           Server host (default: 127.0.0.1)
     --port PORT           Server port (default: 8080)
-    --workers N           Number of parallel workers (default: auto)
+    --workers N|auto      Number of parallel workers (default: 1, serial; auto, half the usable CPUs)
     --verbose             Verbose output
     --report              Generate detailed report
     --install-deps        Install Python dependencies
     --skip-server-build   Skip building the RedisGate server
+    --keep-server         Leave the server running for later runs to reuse
     --timeout SECONDS     Test timeout in seconds (default: 300)
     --help                Show this help message
 """
 
 import argparse
+import asyncio
+import hashlib
+import importlib.util
+import json
 import os
+import signal
+import socket
 import sys
 import subprocess
+import threading
 import time
 import shutil
 import venv
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
+
+from validate_setup import newest_build_input_mtime
 
 try:
     from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    # Panel and Table are imported where they are used (Table only for --report)
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
@@ -49,6 +57,38 @@ if RICH_AVAILABLE:
 else:
     console = Console()
 
+# Python modules the integration tests cannot run without
+REQUIRED_MODULES = ("pytest", "httpx", "upstash_redis")
+
+def available_cpus() -> int:
+    """CPUs this process may run on (the affinity mask honours container/CI CPU sets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# Half the usable cores for pytest-xdist workers, the other half for the server
+CPU_SHARE = max(1, available_cpus() // 2)
+
+def workers_arg(value: str):
+    """Parse --workers: a worker count, or "auto" for ``CPU_SHARE``."""
+    if value == "auto":
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or 'auto', got {value!r}") from None
+
+def thread_limits(workers: int) -> Dict[str, str]:
+    """Thread caps for the server(s) a run with ``workers`` test processes starts.
+    
+    Only parallel runs are capped: they leave half the cores to the test workers.
+    A serial run starts one server, which keeps its default runtime size.
+    """
+    if workers <= 1:
+        return {}
+    # Read by the server's #[tokio::main] runtime
+    return {"TOKIO_WORKER_THREADS": str(CPU_SHARE)}
+
 class TestRunner:
     """Main test runner for RedisGate integration tests."""
     
@@ -57,11 +97,19 @@ class TestRunner:
         self.test_dir = Path(__file__).parent
         self.project_root = self.test_dir.parent.parent
         self.venv_dir = self.test_dir / ".venv"
+        bin_dir = self.venv_dir / ("Scripts" if os.name == 'nt' else "bin")
+        exe_suffix = ".exe" if os.name == 'nt' else ""
+        self.python_cmd = bin_dir / f"python{exe_suffix}"
+        self.pip_cmd = bin_dir / f"pip{exe_suffix}"
         self.results = {}
+        # Set once an install has proved the Python dependencies importable
+        self._deps_ok = False
+        self._xdist: Optional[bool] = None
         
     def run_tests(self) -> bool:
         """Run the integration tests based on the selected mode."""
         if RICH_AVAILABLE:
+            from rich.panel import Panel
             console.print(Panel.fit("🚀 RedisGate Integration Test Suite", style="bold blue"))
         else:
             console.print("🚀 RedisGate Integration Test Suite")
@@ -70,12 +118,8 @@ class TestRunner:
         if not self._setup_environment():
             return False
         
-        # Build server if needed
-        if not self.args.skip_server_build and not self._build_server():
-            return False
-        
-        # Install dependencies if needed
-        if self.args.install_deps and not self._install_dependencies():
+        # Build server and install dependencies (if needed) concurrently
+        if not asyncio.run(self._prepare()):
             return False
         
         # Check dependencies
@@ -83,9 +127,9 @@ class TestRunner:
             return False
         
         # Run the tests
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = self._execute_tests()
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Generate report if requested
         if self.args.report:
@@ -106,24 +150,94 @@ class TestRunner:
         os.environ["REDISGATE_TEST_HOST"] = self.args.host
         os.environ["REDISGATE_TEST_PORT"] = str(self.args.port)
         os.environ["RUST_LOG"] = "info"
+        if self.args.keep_server:
+            os.environ["REDISGATE_KEEP_SERVER"] = "1"
         
         return True
     
-    def _build_server(self) -> bool:
+    def _kept_server_alive(self) -> bool:
+        """Whether a server left by an earlier --keep-server run is still serving."""
+        try:
+            state = json.loads((self.test_dir / ".server.pid").read_text())
+            os.kill(state["pid"], 0)
+        except (OSError, ValueError, KeyError):
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            return sock.connect_ex((state["host"], state["port"])) == 0
+    
+    async def _prepare(self) -> bool:
+        """Build the server and install dependencies, as requested, side by side.
+        
+        The two touch disjoint directories, so the pip downloads overlap the
+        cargo build instead of waiting for it.
+        """
+        steps = []
+        if self.args.keep_server and self._kept_server_alive() and self._server_binary_fresh():
+            # The tests reuse the running server, which runs the current build
+            self._mark_server_binary_fresh()
+            console.print("[green]✅ Reusing the server kept by an earlier --keep-server run[/green]")
+        elif not self.args.skip_server_build:
+            steps.append(self._build_server())
+        if self.args.install_deps:
+            steps.append(self._install_dependencies())
+        return all(await asyncio.gather(*steps))
+    
+    async def _run_command(self, cmd: List[str], cwd: Optional[Path] = None,
+                           timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Run a command without blocking the event loop (output captured unless verbose)."""
+        output = None if self.args.verbose else asyncio.subprocess.PIPE
+        proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd, stdout=output, stderr=output)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return subprocess.CompletedProcess(
+            cmd, proc.returncode,
+            stdout.decode(errors="replace") if stdout else "",
+            stderr.decode(errors="replace") if stderr else ""
+        )
+    
+    def _server_binary_fresh(self) -> bool:
+        """Whether the release binary is newer than every input that affects the build.
+        
+        The inputs are validate_setup's ``BUILD_INPUTS``, so both scripts agree.
+        """
+        binary = self.project_root / "target" / "release" / "redisgate"
+        try:
+            built = binary.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return newest_build_input_mtime(self.project_root) <= built
+    
+    @staticmethod
+    def _mark_server_binary_fresh() -> None:
+        """Tell the test fixtures the binary is up to date, so they do not run cargo again."""
+        os.environ["REDISGATE_SERVER_BINARY_FRESH"] = "1"
+    
+    async def _build_server(self) -> bool:
         """Build the RedisGate server."""
+        # Skip even cargo's own (slower) up-to-date check when nothing changed
+        if self._server_binary_fresh():
+            console.print("[green]✅ Server binary is up to date[/green]")
+            self._mark_server_binary_fresh()
+            return True
+        
         console.print("[blue]Building RedisGate server...[/blue]")
         
         try:
-            result = subprocess.run(
-                ["cargo", "build"],
+            # Same release build the test fixtures launch, so their build step is a no-op
+            result = await self._run_command(
+                ["cargo", "build", "--release", "--bin", "redisgate"],
                 cwd=self.project_root,
-                capture_output=not self.args.verbose,
-                text=True,
                 timeout=300  # 5 minute timeout for build
             )
             
             if result.returncode == 0:
                 console.print("[green]✅ Server built successfully[/green]")
+                self._mark_server_binary_fresh()
                 return True
             else:
                 console.print(f"[red]❌ Server build failed with exit code {result.returncode}[/red]")
@@ -138,39 +252,46 @@ class TestRunner:
             console.print(f"[red]❌ Failed to build server: {e}[/red]")
             return False
     
-    def _install_dependencies(self) -> bool:
+    async def _install_dependencies(self) -> bool:
         """Install Python dependencies in a virtual environment."""
         console.print("[blue]Installing Python dependencies...[/blue]")
         
         try:
             # Create virtual environment if it doesn't exist
-            if not self.venv_dir.exists():
+            venv_created = not self.venv_dir.exists()
+            if venv_created:
                 console.print("[yellow]Creating virtual environment...[/yellow]")
-                venv.create(self.venv_dir, with_pip=True)
+                await asyncio.to_thread(venv.create, self.venv_dir, with_pip=True)
+            
+            # Skip installing entirely when requirements.txt and the Python
+            # version match what the venv was last populated from
+            requirements_file = self.test_dir / "requirements.txt"
+            deps_stamp = self.venv_dir / ".deps.sha256"
+            deps_hash = self._dependencies_hash(requirements_file)
+            if deps_stamp.exists() and deps_stamp.read_text() == deps_hash:
+                console.print("[green]✅ Dependencies are up to date[/green]")
+                self._deps_ok = True
+                return True
             
-            # Get pip executable
-            if os.name == 'nt':  # Windows
-                pip_cmd = self.venv_dir / "Scripts" / "pip.exe"
-                python_cmd = self.venv_dir / "Scripts" / "python.exe"
-            else:  # Unix-like
-                pip_cmd = self.venv_dir / "bin" / "pip"
-                python_cmd = self.venv_dir / "bin" / "python"
+            pip_flags = ["--no-input", "--disable-pip-version-check", "--require-virtualenv"]
             
-            # Upgrade pip
-            subprocess.run([str(python_cmd), "-m", "pip", "install", "--upgrade", "pip"], 
-                         check=True, capture_output=not self.args.verbose)
+            # Upgrade pip in a fresh venv only
+            if venv_created:
+                result = await self._run_command(
+                    [str(self.python_cmd), "-m", "pip", "install", *pip_flags, "--upgrade", "pip"]
+                )
+                result.check_returncode()
             
             # Install requirements
-            requirements_file = self.test_dir / "requirements.txt"
             if requirements_file.exists():
-                result = subprocess.run(
-                    [str(pip_cmd), "install", "-r", str(requirements_file)],
-                    capture_output=not self.args.verbose,
-                    text=True
+                result = await self._run_command(
+                    [str(self.pip_cmd), "install", *pip_flags, "-r", str(requirements_file)]
                 )
                 
                 if result.returncode == 0:
+                    deps_stamp.write_text(deps_hash)
                     console.print("[green]✅ Dependencies installed successfully[/green]")
+                    self._deps_ok = True
                     return True
                 else:
                     console.print(f"[red]❌ Failed to install dependencies[/red]")
@@ -185,6 +306,12 @@ class TestRunner:
             console.print(f"[red]❌ Failed to install dependencies: {e}[/red]")
             return False
     
+    @staticmethod
+    def _dependencies_hash(requirements_file: Path) -> str:
+        """Hash requirements.txt together with the Python version the venv is built from."""
+        requirements = requirements_file.read_bytes() if requirements_file.exists() else b""
+        return hashlib.sha256(requirements + sys.version.encode()).hexdigest()
+    
     def _check_dependencies(self) -> bool:
         """Check if required dependencies are available."""
         console.print("[blue]Checking dependencies...[/blue]")
@@ -200,19 +327,26 @@ class TestRunner:
             console.print(f"[red]❌ Missing required commands: {', '.join(missing_commands)}[/red]")
             return False
         
-        # Check Python modules
-        try:
-            # Use the virtual environment python if available
-            if self.venv_dir.exists():
-                if os.name == 'nt':
-                    python_cmd = self.venv_dir / "Scripts" / "python.exe"
-                else:
-                    python_cmd = self.venv_dir / "bin" / "python"
-            else:
-                python_cmd = "python3"
+        # A fresh (or verified up-to-date) install already proved the modules import
+        if self._deps_ok:
+            console.print("[green]✅ All dependencies available[/green]")
+            return True
+        
+        # Tests run in this interpreter: look the modules up in-process
+        if self._runs_in_test_interpreter():
+            missing_modules = [m for m in REQUIRED_MODULES if importlib.util.find_spec(m) is None]
+            if missing_modules:
+                console.print(f"[red]❌ Required Python modules not available: {', '.join(missing_modules)}[/red]")
+                console.print("[yellow]Run with --install-deps to install them automatically[/yellow]")
+                return False
             
+            console.print("[green]✅ All dependencies available[/green]")
+            return True
+        
+        # Check Python modules in the virtual environment's interpreter
+        try:
             result = subprocess.run(
-                [str(python_cmd), "-c", "import pytest, httpx, upstash_redis"],
+                [str(self.python_cmd), "-c", f"import {', '.join(REQUIRED_MODULES)}"],
                 capture_output=True,
                 text=True
             )
@@ -233,45 +367,37 @@ class TestRunner:
         """Execute the tests using pytest."""
         console.print("[blue]Running integration tests...[/blue]")
         
-        # Determine python executable
-        if self.venv_dir.exists():
-            if os.name == 'nt':
-                python_cmd = self.venv_dir / "Scripts" / "python.exe"
-            else:
-                python_cmd = self.venv_dir / "bin" / "python"
-        else:
-            python_cmd = "python3"
+        # Without pytest-xdist, spread the test files over parallel pytest processes
+        shards = self._test_shards()
+        if shards:
+            return self._execute_test_shards(shards)
         
         # Build pytest command
         pytest_args = self._build_pytest_args()
-        cmd = [str(python_cmd), "-m", "pytest"] + pytest_args
+        
+        # Already running in the interpreter we would spawn: skip the extra
+        # interpreter and pytest import startup
+        if self._runs_in_test_interpreter():
+            return self._execute_tests_in_process(pytest_args)
+        
+        cmd = [str(self.python_cmd), "-m", "pytest"] + pytest_args
         
         console.print(f"[green]Running: {' '.join(cmd)}[/green]")
         
         # Set environment
         env = os.environ.copy()
+        env.update(thread_limits(self._workers()))
         env["PYTHONPATH"] = str(self.test_dir)
         
-        # Run tests
+        # Run tests, echoing their output as it arrives
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.test_dir,
-                env=env,
-                capture_output=not self.args.verbose,
-                text=True,
-                timeout=self.args.timeout
-            )
+            returncode = asyncio.run(self._stream_command(cmd, env, self.args.timeout))
             
-            if result.returncode == 0:
+            if returncode == 0:
                 console.print("[green]✅ All tests passed![/green]")
                 return True
             else:
-                console.print(f"[red]❌ Tests failed with exit code {result.returncode}[/red]")
-                if not self.args.verbose and result.stdout:
-                    console.print(result.stdout)
-                if result.stderr:
-                    console.print(f"[red]Errors:[/red]\n{result.stderr}")
+                console.print(f"[red]❌ Tests failed with exit code {returncode}[/red]")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -281,10 +407,162 @@ class TestRunner:
             console.print(f"[red]❌ Failed to run tests: {e}[/red]")
             return False
     
-    def _build_pytest_args(self) -> List[str]:
-        """Build pytest command line arguments."""
+    def _workers(self) -> int:
+        """Number of parallel test processes asked for with --workers."""
+        return CPU_SHARE if self.args.workers == "auto" else self.args.workers
+    
+    def _xdist_available(self) -> bool:
+        """Whether pytest-xdist is importable in the interpreter the tests run in."""
+        if self._xdist is None:
+            if self._runs_in_test_interpreter():
+                self._xdist = importlib.util.find_spec("xdist") is not None
+            else:
+                result = subprocess.run([str(self.python_cmd), "-c", "import xdist"], capture_output=True)
+                self._xdist = result.returncode == 0
+        return self._xdist
+    
+    def _test_shards(self) -> List[List[str]]:
+        """Split the test files into one group per worker when xdist cannot parallelise.
+        
+        Only ``--mode all`` spans several modules; the other modes select a single
+        module or a marker, and simply run in one process without xdist.
+        """
+        if self.args.mode != "all" or self._workers() <= 1 or self._xdist_available():
+            return []
+        files = sorted(p.name for p in self.test_dir.glob("test_*.py"))
+        count = min(self._workers(), len(files))
+        return [files[i::count] for i in range(count)]
+    
+    def _execute_test_shards(self, shards: List[List[str]]) -> bool:
+        """Run each group of test files in its own pytest process, all at once.
+        
+        Every shard starts its own server on its own port (``--port`` + shard
+        index); a ``--keep-server`` server on the first shard's port is stopped.
+        """
+        python_cmd = sys.executable if self._runs_in_test_interpreter() else str(self.python_cmd)
+        console.print(f"[yellow]pytest-xdist not available, running {len(shards)} pytest processes[/yellow]")
+        
+        env = os.environ.copy()
+        env.update(thread_limits(self._workers()))
+        env["PYTHONPATH"] = str(self.test_dir)
+        # One record cannot hold several servers: shards stop what they start
+        env.pop("REDISGATE_KEEP_SERVER", None)
+        
+        async def run_shards() -> List[int]:
+            runs = []
+            for index, files in enumerate(shards):
+                cmd = [python_cmd, "-m", "pytest", *self._build_pytest_args(files)]
+                console.print(f"[green]Running shard {index}: {' '.join(cmd)}[/green]")
+                shard_env = dict(env, REDISGATE_TEST_PORT=str(self.args.port + index))
+                runs.append(self._stream_command(cmd, shard_env, self.args.timeout, prefix=f"[{index}] "))
+            return await asyncio.gather(*runs)
+        
+        try:
+            returncode = max(asyncio.run(run_shards()))
+        except subprocess.TimeoutExpired:
+            console.print(f"[red]❌ Tests timed out after {self.args.timeout} seconds[/red]")
+            return False
+        except Exception as e:
+            console.print(f"[red]❌ Failed to run tests: {e}[/red]")
+            return False
+        
+        if returncode == 0:
+            console.print("[green]✅ All tests passed![/green]")
+            return True
+        
+        console.print(f"[red]❌ Tests failed with exit code {returncode}[/red]")
+        return False
+    
+    async def _stream_command(self, cmd: List[str], env: Dict[str, str], timeout: float,
+                              prefix: str = "") -> int:
+        """Run a command in the test dir, copying its merged stdout/stderr through line by line.
+        
+        ``prefix`` is put in front of every line, to tell concurrent commands apart.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=self.test_dir,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        
+        tag = prefix.encode()
+        
+        async def pump() -> None:
+            async for line in proc.stdout:
+                sys.stdout.buffer.write(tag + line)
+                sys.stdout.buffer.flush()
+        
+        try:
+            await asyncio.wait_for(asyncio.gather(pump(), proc.wait()), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return proc.returncode
+    
+    def _runs_in_test_interpreter(self) -> bool:
+        """Whether this script already runs in the interpreter the tests would use."""
+        if not self.venv_dir.exists():
+            return True
+        return Path(sys.prefix).resolve() == self.venv_dir.resolve()
+    
+    def _execute_tests_in_process(self, pytest_args: List[str]) -> bool:
+        """Execute the tests with ``pytest.main`` in this interpreter.
+        
+        ``--timeout`` bounds each test and, as in the subprocess path, the whole
+        run: when it runs out, the main thread gets SIGINT, as on Ctrl+C. The
+        timer is a thread rather than SIGALRM, which pytest-timeout resets per test.
+        """
+        import pytest
+        
+        console.print(f"[green]Running: pytest {' '.join(pytest_args)} (in-process)[/green]")
+        
+        timed_out = threading.Event()
+        
+        def interrupt() -> None:
+            timed_out.set()
+            signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+        
+        # Same working directory, import path and thread caps the subprocess would
+        # get, all put back afterwards
+        limits = thread_limits(self._workers())
+        saved_env = {name: os.environ.get(name) for name in limits}
+        os.environ.update(limits)
+        cwd = os.getcwd()
+        sys.path.insert(0, str(self.test_dir))
+        timer = threading.Timer(self.args.timeout, interrupt)
+        timer.daemon = True
+        try:
+            os.chdir(self.test_dir)
+            timer.start()
+            exit_code = pytest.main(pytest_args)
+        finally:
+            timer.cancel()
+            os.chdir(cwd)
+            sys.path.remove(str(self.test_dir))
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        
+        if timed_out.is_set():
+            console.print(f"[red]❌ Tests timed out after {self.args.timeout} seconds[/red]")
+            return False
+        
+        if exit_code == 0:
+            console.print("[green]✅ All tests passed![/green]")
+            return True
+        
+        console.print(f"[red]❌ Tests failed with exit code {int(exit_code)}[/red]")
+        return False
+    
+    def _build_pytest_args(self, paths: Sequence[str] = (".",)) -> List[str]:
+        """Build pytest command line arguments for the tests under ``paths``."""
         args = [
-            ".",
+            *paths,
             "-v",
             "--tb=short",
             "--color=yes",
@@ -320,9 +598,10 @@ class TestRunner:
                 "-m", "not benchmark"
             ])
         
-        # Add parallel execution
-        if self.args.workers:
-            args.extend(["-n", str(self.args.workers)])
+        # Add parallel execution (without xdist, see _test_shards)
+        workers = self._workers()
+        if workers > 1 and self._xdist_available():
+            args.extend(["-n", str(workers)])
         
         # Add verbose output
         if self.args.verbose:
@@ -338,6 +617,8 @@ class TestRunner:
         duration = end_time - start_time
         
         if RICH_AVAILABLE:
+            from rich.table import Table
+            
             # Create report table
             table = Table(title="RedisGate Integration Test Report")
             table.add_column("Metric", style="cyan")
@@ -357,15 +638,16 @@ class TestRunner:
         
         # Save report to file
         report_file = self.test_dir / "test_report.txt"
-        with open(report_file, "w") as f:
-            f.write(f"RedisGate Integration Test Report\n")
-            f.write(f"==================================\n")
-            f.write(f"Test Mode: {self.args.mode}\n")
-            f.write(f"Duration: {duration:.2f}s\n")
-            f.write(f"Python Version: {sys.version}\n")
-            f.write(f"Test Directory: {self.test_dir}\n")
-            f.write(f"Project Root: {self.project_root}\n")
-            f.write(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        report_file.write_text(
+            f"RedisGate Integration Test Report\n"
+            f"==================================\n"
+            f"Test Mode: {self.args.mode}\n"
+            f"Duration: {duration:.2f}s\n"
+            f"Python Version: {sys.version}\n"
+            f"Test Directory: {self.test_dir}\n"
+            f"Project Root: {self.project_root}\n"
+            f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        )
         
         console.print(f"[green]Report saved to: {report_file}[/green]")
 
@@ -406,8 +688,9 @@ Examples:
     
     parser.add_argument(
         "--workers",
-        type=int,
-        help="Number of parallel workers (default: auto)"
+        type=workers_arg,
+        default=1,
+        help="Number of parallel workers, or 'auto' for half the usable CPUs (default: 1, serial)"
     )
     
     parser.add_argument(
@@ -434,6 +717,12 @@ Examples:
         help="Skip building the RedisGate server"
     )
     
+    parser.add_argument(
+        "--keep-server",
+        action="store_true",
+        help="Leave the server running after the tests, for later runs to reuse"
+    )
+    
     parser.add_argument(
         "--timeout",
         type=int,
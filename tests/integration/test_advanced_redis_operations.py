@@ -11,11 +11,10 @@ This module tests advanced Redis features through RedisGate's HTTP API:
 
 import pytest
 import asyncio
-import uuid
 import json
 from typing import Dict, Any, List
 
-from conftest import UpstashRedisClient
+from conftest import PIPELINE_CHUNK_SIZE, UpstashRedisClient, unique_id
 
 
 class TestRedisPipelines:
@@ -25,26 +24,22 @@ class TestRedisPipelines:
     @pytest.mark.integration
     async def test_pipeline_basic_operations(self, upstash_redis: UpstashRedisClient):
         """Test basic pipeline operations."""
-        # Note: Upstash Redis client may handle pipelines differently
-        # We'll test batch operations instead
         keys_values = {}
         
         # Prepare test data
         for i in range(5):
-            key = f"pipeline_test_{i}_{uuid.uuid4().hex[:8]}"
-            value = f"value_{i}_{uuid.uuid4().hex[:8]}"
+            key = f"pipeline_test_{i}_{unique_id()}"
+            value = f"value_{i}_{unique_id()}"
             keys_values[key] = value
         
-        # Set all values (simulating pipeline)
-        set_tasks = [upstash_redis.set(k, v) for k, v in keys_values.items()]
-        set_results = await asyncio.gather(*set_tasks)
+        # Set all values in one pipeline
+        set_results = await upstash_redis.pipeline([["SET", k, v] for k, v in keys_values.items()])
         
         # Verify all sets succeeded
-        assert all(result == "OK" for result in set_results)
+        assert set_results == ["OK"] * len(keys_values)
         
-        # Get all values (simulating pipeline)
-        get_tasks = [upstash_redis.get(k) for k in keys_values.keys()]
-        get_results = await asyncio.gather(*get_tasks)
+        # Get all values in one pipeline
+        get_results = await upstash_redis.pipeline([["GET", k] for k in keys_values.keys()])
         
         # Verify all values are correct
         for i, (key, expected_value) in enumerate(keys_values.items()):
@@ -58,7 +53,7 @@ class TestRedisPipelines:
         
         # Phase 1: Set multiple keys
         for i in range(3):
-            key = f"batch_mixed_{i}_{uuid.uuid4().hex[:8]}"
+            key = f"batch_mixed_{i}_{unique_id()}"
             value = f"value_{i}"
             test_data[key] = value
         
@@ -70,7 +65,7 @@ class TestRedisPipelines:
         keys_list = list(test_data.keys())
         
         # GET first key, SET new key, DELETE second key
-        new_key = f"batch_new_{uuid.uuid4().hex[:8]}"
+        new_key = f"batch_new_{unique_id()}"
         new_value = "new_batch_value"
         
         operations = [
@@ -102,34 +97,30 @@ class TestRedisTransactions:
         # Since Upstash REST API may not support true MULTI/EXEC,
         # we'll test atomic-like behavior with careful operation ordering
         
-        key1 = f"atomic_test_1_{uuid.uuid4().hex[:8]}"
-        key2 = f"atomic_test_2_{uuid.uuid4().hex[:8]}"
+        key1 = f"atomic_test_1_{unique_id()}"
+        key2 = f"atomic_test_2_{unique_id()}"
         
-        # Initial setup
-        await upstash_redis.set(key1, "100")
-        await upstash_redis.set(key2, "200")
+        # Initial setup, reading the values back in the same pipeline
+        _, _, val1, val2 = await upstash_redis.pipeline([
+            ["SET", key1, "100"],
+            ["SET", key2, "200"],
+            ["GET", key1],
+            ["GET", key2],
+        ])
         
         # Simulate atomic transfer: subtract from key1, add to key2
-        val1 = await upstash_redis.get(key1)
-        val2 = await upstash_redis.get(key2)
-        
         transfer_amount = 50
         new_val1 = str(int(val1) - transfer_amount)
         new_val2 = str(int(val2) + transfer_amount)
         
-        # Perform "atomic" update
-        update_tasks = [
-            upstash_redis.set(key1, new_val1),
-            upstash_redis.set(key2, new_val2)
-        ]
-        results = await asyncio.gather(*update_tasks)
+        # Perform "atomic" update as one pipelined request
+        results = await upstash_redis.pipeline([["SET", key1, new_val1], ["SET", key2, new_val2]])
         
         # Verify both operations succeeded
         assert all(result == "OK" for result in results)
         
         # Verify final values
-        final_val1 = await upstash_redis.get(key1)
-        final_val2 = await upstash_redis.get(key2)
+        final_val1, final_val2 = await upstash_redis.pipeline([["GET", key1], ["GET", key2]])
         
         assert final_val1 == "50"
         assert final_val2 == "250"
@@ -142,7 +133,7 @@ class TestRedisAdvancedStringOperations:
     @pytest.mark.integration  
     async def test_string_operations_simulation(self, upstash_redis: UpstashRedisClient):
         """Test string operations that can be simulated with basic commands."""
-        key = f"string_ops_{uuid.uuid4().hex[:8]}"
+        key = f"string_ops_{unique_id()}"
         
         # Test append-like operation
         await upstash_redis.set(key, "Hello")
@@ -159,7 +150,7 @@ class TestRedisAdvancedStringOperations:
         
         # Test substring-like operation
         substring = result[0:5]  # "Hello"
-        sub_key = f"substring_{uuid.uuid4().hex[:8]}"
+        sub_key = f"substring_{unique_id()}"
         await upstash_redis.set(sub_key, substring)
         
         sub_result = await upstash_redis.get(sub_key)
@@ -173,18 +164,17 @@ class TestRedisDataStructureSimulation:
     @pytest.mark.integration
     async def test_list_simulation_with_json(self, upstash_redis: UpstashRedisClient):
         """Simulate list operations using JSON strings."""
-        key = f"list_sim_{uuid.uuid4().hex[:8]}"
+        key = f"list_sim_{unique_id()}"
         
         # Initialize empty list
         initial_list = []
         await upstash_redis.set(key, json.dumps(initial_list))
         
-        # Add elements (LPUSH simulation)
-        current_list = json.loads(await upstash_redis.get(key))
+        # Add elements (LPUSH simulation); the local copy tracks what was written
+        current_list = initial_list
         current_list.insert(0, "first")
         await upstash_redis.set(key, json.dumps(current_list))
         
-        current_list = json.loads(await upstash_redis.get(key))
         current_list.insert(0, "second")
         await upstash_redis.set(key, json.dumps(current_list))
         
@@ -206,14 +196,14 @@ class TestRedisDataStructureSimulation:
     @pytest.mark.integration
     async def test_hash_simulation_with_json(self, upstash_redis: UpstashRedisClient):
         """Simulate hash operations using JSON strings."""
-        key = f"hash_sim_{uuid.uuid4().hex[:8]}"
+        key = f"hash_sim_{unique_id()}"
         
         # Initialize empty hash
         initial_hash = {}
         await upstash_redis.set(key, json.dumps(initial_hash))
         
-        # Set hash fields (HSET simulation)
-        current_hash = json.loads(await upstash_redis.get(key))
+        # Set hash fields (HSET simulation); the local copy tracks what was written
+        current_hash = initial_hash
         current_hash["field1"] = "value1"
         current_hash["field2"] = "value2"
         current_hash["field3"] = "value3"
@@ -242,14 +232,14 @@ class TestRedisDataStructureSimulation:
     @pytest.mark.integration
     async def test_set_simulation_with_json(self, upstash_redis: UpstashRedisClient):
         """Simulate set operations using JSON strings."""
-        key = f"set_sim_{uuid.uuid4().hex[:8]}"
+        key = f"set_sim_{unique_id()}"
         
         # Initialize empty set
         initial_set = []
         await upstash_redis.set(key, json.dumps(initial_set))
         
-        # Add members (SADD simulation)
-        current_set = json.loads(await upstash_redis.get(key))
+        # Add members (SADD simulation); the local copy tracks what was written
+        current_set = initial_set
         members_to_add = ["member1", "member2", "member3", "member1"]  # member1 duplicated
         
         for member in members_to_add:
@@ -268,7 +258,7 @@ class TestRedisDataStructureSimulation:
         assert "member4" not in final_set
         
         # Remove member (SREM simulation)
-        current_set = json.loads(await upstash_redis.get(key))
+        current_set = final_set
         if "member2" in current_set:
             current_set.remove("member2")
         await upstash_redis.set(key, json.dumps(current_set))
@@ -288,37 +278,35 @@ class TestRedisBenchmarkOperations:
     async def test_rapid_set_get_operations(self, upstash_redis: UpstashRedisClient):
         """Test rapid SET/GET operations for performance."""
         num_operations = 100
-        keys_values = {}
         
         # Generate test data
-        for i in range(num_operations):
-            key = f"perf_test_{i}_{uuid.uuid4().hex[:8]}"
-            value = f"performance_value_{i}_{uuid.uuid4().hex[:8]}"
-            keys_values[key] = value
+        pairs = [
+            (f"perf_test_{i}_{unique_id()}", f"performance_value_{i}_{unique_id()}")
+            for i in range(num_operations)
+        ]
         
         # Measure SET operations
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        set_tasks = [upstash_redis.set(k, v) for k, v in keys_values.items()]
-        set_results = await asyncio.gather(*set_tasks)
+        # One pipeline request for all SETs
+        set_results = await upstash_redis.pipeline([["SET", k, v] for k, v in pairs])
         
-        set_duration = time.time() - start_time
+        set_duration = time.perf_counter() - start_time
         
         # Verify all sets succeeded
         assert all(result == "OK" for result in set_results)
         
         # Measure GET operations
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        get_tasks = [upstash_redis.get(k) for k in keys_values.keys()]
-        get_results = await asyncio.gather(*get_tasks)
+        # One pipeline request for all GETs
+        get_results = await upstash_redis.pipeline([["GET", k] for k, _ in pairs])
         
-        get_duration = time.time() - start_time
+        get_duration = time.perf_counter() - start_time
         
         # Verify all gets returned correct values
-        for i, (key, expected_value) in enumerate(keys_values.items()):
-            assert get_results[i] == expected_value
+        assert get_results == [v for _, v in pairs]
         
         # Performance assertions (adjust thresholds as needed)
         sets_per_second = num_operations / set_duration
@@ -336,27 +324,21 @@ class TestRedisBenchmarkOperations:
     async def test_large_batch_operations(self, upstash_redis: UpstashRedisClient):
         """Test large batch operations."""
         num_keys = 1000
-        batch_size = 50
+        batch_size = PIPELINE_CHUNK_SIZE
         
         # Generate test data
-        all_keys = []
-        for i in range(num_keys):
-            key = f"large_batch_{i}_{uuid.uuid4().hex[:8]}"
-            value = f"batch_value_{i}"
-            all_keys.append((key, value))
+        all_keys = [(f"large_batch_{i}_{unique_id()}", f"batch_value_{i}") for i in range(num_keys)]
         
-        # Process in batches to avoid overwhelming the server
+        # Process in batches, one pipeline request per batch
         for i in range(0, num_keys, batch_size):
             batch = all_keys[i:i + batch_size]
             
             # Set batch
-            set_tasks = [upstash_redis.set(k, v) for k, v in batch]
-            set_results = await asyncio.gather(*set_tasks)
+            set_results = await upstash_redis.pipeline([["SET", k, v] for k, v in batch])
             assert all(result == "OK" for result in set_results)
             
             # Get batch
-            get_tasks = [upstash_redis.get(k) for k, v in batch]
-            get_results = await asyncio.gather(*get_tasks)
+            get_results = await upstash_redis.pipeline([["GET", k] for k, v in batch])
             
             # Verify batch
             for j, (key, expected_value) in enumerate(batch):
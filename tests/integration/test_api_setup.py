@@ -12,10 +12,9 @@ and that all the management APIs are functional.
 """
 
 import pytest
-import uuid
 from typing import Dict, Any
 
-from conftest import RedisGateClient
+from conftest import RedisGateClient, unique_id
 
 
 class TestApiSetup:
@@ -26,8 +25,8 @@ class TestApiSetup:
     async def test_complete_api_setup_flow(self, client: RedisGateClient):
         """Test the complete API setup flow used by integration tests."""
         # Create test user
-        test_email = f"test-{uuid.uuid4()}@example.com"
-        test_username = f"testuser-{uuid.uuid4().hex[:8]}"
+        test_email = f"test-{unique_id()}@example.com"
+        test_username = f"testuser-{unique_id()}"
         test_password = "testpassword123"
         
         # Step 1: Register user
@@ -42,13 +41,13 @@ class TestApiSetup:
         assert client.auth_token is not None
         
         # Step 3: Create organization
-        org_name = f"test-org-{uuid.uuid4().hex[:8]}"
+        org_name = f"test-org-{unique_id()}"
         org = await client.create_organization(org_name, "Test organization")
         assert "id" in org
         assert org["name"] == org_name
         
         # Step 4: Create Redis instance
-        instance_name = f"test-redis-{uuid.uuid4().hex[:8]}"
+        instance_name = f"test-redis-{unique_id()}"
         instance = await client.create_redis_instance(
             org["id"], instance_name, 256
         )
@@ -56,7 +55,7 @@ class TestApiSetup:
         assert instance["name"] == instance_name
         
         # Step 5: Create API key
-        api_key_name = f"test-key-{uuid.uuid4().hex[:8]}"
+        api_key_name = f"test-key-{unique_id()}"
         api_key_response = await client.create_api_key(
             org["id"], api_key_name, instance["id"]
         )
@@ -70,8 +69,8 @@ class TestApiSetup:
     @pytest.mark.integration
     async def test_user_registration(self, client: RedisGateClient):
         """Test user registration API."""
-        test_email = f"test-{uuid.uuid4()}@example.com"
-        test_username = f"testuser-{uuid.uuid4().hex[:8]}"
+        test_email = f"test-{unique_id()}@example.com"
+        test_username = f"testuser-{unique_id()}"
         test_password = "testpassword123"
         
         response = await client.register_user(test_email, test_username, test_password)
@@ -83,17 +82,12 @@ class TestApiSetup:
         
     @pytest.mark.api
     @pytest.mark.integration
-    async def test_user_login(self, client: RedisGateClient):
-        """Test user login API."""
-        test_email = f"test-{uuid.uuid4()}@example.com"
-        test_username = f"testuser-{uuid.uuid4().hex[:8]}"
-        test_password = "testpassword123"
-        
-        # Register user first
-        await client.register_user(test_email, test_username, test_password)
+    async def test_user_login(self, client: RedisGateClient, session_user: Dict[str, Any]):
+        """Test user login API (as the session's already registered user)."""
+        assert client.auth_token is None
         
         # Test login
-        response = await client.login(test_email, test_password)
+        response = await client.login(session_user["email"], session_user["password"])
         
         assert "data" in response
         assert response["success"] is True
@@ -102,61 +96,30 @@ class TestApiSetup:
         
     @pytest.mark.api
     @pytest.mark.integration
-    async def test_organization_creation(self, authenticated_client: RedisGateClient):
-        """Test organization creation API."""
-        org_name = f"test-org-{uuid.uuid4().hex[:8]}"
-        description = "Test organization for API testing"
-        
-        response = await authenticated_client.create_organization(org_name, description)
-        
-        assert "id" in response
-        assert response["name"] == org_name
-        assert response["description"] == description
-        assert "slug" in response
+    async def test_organization_creation(self, session_org: Dict[str, Any]):
+        """Test organization creation API (the session organization's response)."""
+        assert "id" in session_org
+        assert session_org["name"].startswith("test-org-")
+        assert session_org["description"] == "Test organization"
+        assert "slug" in session_org
         
     @pytest.mark.api
     @pytest.mark.integration
-    async def test_redis_instance_creation(self, authenticated_client: RedisGateClient):
-        """Test Redis instance creation API."""
-        # Create organization first
-        org_name = f"test-org-{uuid.uuid4().hex[:8]}"
-        org = await authenticated_client.create_organization(org_name, "Test organization")
-        
-        # Create Redis instance
-        instance_name = f"test-redis-{uuid.uuid4().hex[:8]}"
-        response = await authenticated_client.create_redis_instance(
-            org["id"], instance_name, 256
-        )
-        
-        assert "id" in response
-        assert response["name"] == instance_name
-        assert "slug" in response
-        assert response["max_memory"] >= 256 * 1024 * 1024  # Converted to bytes
+    async def test_redis_instance_creation(self, session_instance: Dict[str, Any]):
+        """Test Redis instance creation API (the session instance's response)."""
+        assert "id" in session_instance
+        assert session_instance["name"].startswith("test-redis-")
+        assert "slug" in session_instance
+        assert session_instance["max_memory"] >= 256 * 1024 * 1024  # Converted to bytes
         
     @pytest.mark.api
     @pytest.mark.integration
-    async def test_api_key_creation(self, authenticated_client: RedisGateClient):
-        """Test API key creation API."""
-        # Create organization
-        org_name = f"test-org-{uuid.uuid4().hex[:8]}"
-        org = await authenticated_client.create_organization(org_name, "Test organization")
-        
-        # Create Redis instance
-        instance_name = f"test-redis-{uuid.uuid4().hex[:8]}"
-        instance = await authenticated_client.create_redis_instance(
-            org["id"], instance_name, 256
-        )
-        
-        # Create API key
-        api_key_name = f"test-key-{uuid.uuid4().hex[:8]}"
-        response = await authenticated_client.create_api_key(
-            org["id"], api_key_name, instance["id"]
-        )
-        
+    async def test_api_key_creation(self, session_api_key: Dict[str, Any]):
+        """Test API key creation API (the session API key's response)."""
         # API key response has structure: {'api_key': {...}, 'key': '...'}
-        assert "api_key" in response
-        assert "key" in response
-        assert response["api_key"]["name"] == api_key_name
-        assert "id" in response["api_key"]
-        assert "scopes" in response["api_key"]
-        assert len(response["api_key"]["scopes"]) > 0
\ No newline at end of file
+        assert "api_key" in session_api_key
+        assert "key" in session_api_key
+        assert session_api_key["api_key"]["name"].startswith("test-key-")
+        assert "id" in session_api_key["api_key"]
+        assert "scopes" in session_api_key["api_key"]
+        assert len(session_api_key["api_key"]["scopes"]) > 0
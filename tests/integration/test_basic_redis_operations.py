@@ -10,10 +10,18 @@ This module tests fundamental Redis operations through RedisGate's HTTP API:
 
 import pytest
 import asyncio
-import uuid
+import base64
 from typing import Dict, Any
 
-from conftest import UpstashRedisClient
+from conftest import UpstashRedisClient, unique_id
+
+# 1 MB value for test_large_value and 1 KB key body for test_very_long_key,
+# built once per process
+LARGE_VALUE = "x" * (1024 * 1024)
+LONG_KEY_BODY = "x" * 1000
+# Binary payload for test_binary_like_strings and its base64 form
+BINARY_DATA = b"This is binary data with null bytes: \x00\x01\x02\x03"
+BASE64_VALUE = base64.b64encode(BINARY_DATA).decode('utf-8')
 
 
 class TestBasicRedisOperations:
@@ -30,7 +38,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration  
     async def test_set_and_get_string(self, upstash_redis: UpstashRedisClient):
         """Test setting and getting a string value."""
-        key = f"test_string_{uuid.uuid4().hex[:8]}"
+        key = f"test_string_{unique_id()}"
         value = "Hello, RedisGate!"
         
         # Set the value
@@ -45,7 +53,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_set_and_get_unicode(self, upstash_redis: UpstashRedisClient):
         """Test setting and getting Unicode strings."""
-        key = f"test_unicode_{uuid.uuid4().hex[:8]}"
+        key = f"test_unicode_{unique_id()}"
         value = "Hello 世界! 🚀 Testing unicode characters: áéíóú ñ"
         
         # Set the value
@@ -60,7 +68,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_set_overwrite(self, upstash_redis: UpstashRedisClient):
         """Test overwriting an existing key."""
-        key = f"test_overwrite_{uuid.uuid4().hex[:8]}"
+        key = f"test_overwrite_{unique_id()}"
         value1 = "original_value"
         value2 = "new_value"
         
@@ -78,7 +86,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_get_nonexistent_key(self, upstash_redis: UpstashRedisClient):
         """Test getting a key that doesn't exist."""
-        key = f"nonexistent_{uuid.uuid4().hex[:8]}"
+        key = f"nonexistent_{unique_id()}"
         
         result = await upstash_redis.get(key)
         assert result is None
@@ -87,7 +95,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_delete_key(self, upstash_redis: UpstashRedisClient):
         """Test deleting a key."""
-        key = f"test_delete_{uuid.uuid4().hex[:8]}"
+        key = f"test_delete_{unique_id()}"
         value = "to_be_deleted"
         
         # Set the value
@@ -106,7 +114,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_delete_nonexistent_key(self, upstash_redis: UpstashRedisClient):
         """Test deleting a key that doesn't exist."""
-        key = f"nonexistent_delete_{uuid.uuid4().hex[:8]}"
+        key = f"nonexistent_delete_{unique_id()}"
         
         delete_result = await upstash_redis.delete(key)
         assert delete_result == 0  # 0 keys deleted
@@ -115,7 +123,7 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_empty_string_value(self, upstash_redis: UpstashRedisClient):
         """Test setting and getting an empty string."""
-        key = f"test_empty_{uuid.uuid4().hex[:8]}"
+        key = f"test_empty_{unique_id()}"
         value = ""
         
         # Set empty value
@@ -130,9 +138,8 @@ class TestBasicRedisOperations:
     @pytest.mark.integration
     async def test_large_value(self, upstash_redis: UpstashRedisClient):
         """Test setting and getting a large string value."""
-        key = f"test_large_{uuid.uuid4().hex[:8]}"
-        # Create a 1MB string
-        value = "x" * (1024 * 1024)
+        key = f"test_large_{unique_id()}"
+        value = LARGE_VALUE
         
         # Set large value
         set_result = await upstash_redis.set(key, value)
@@ -144,44 +151,39 @@ class TestBasicRedisOperations:
     
     @pytest.mark.redis
     @pytest.mark.integration
-    async def test_special_characters_in_key(self, upstash_redis: UpstashRedisClient):
+    @pytest.mark.parametrize("key_template", [
+        "test:key:{}",
+        "test-key-{}",
+        "test_key_{}",
+        "test.key.{}",
+        "test/key/{}",
+    ])
+    async def test_special_characters_in_key(self, upstash_redis: UpstashRedisClient, key_template: str):
         """Test keys with special characters."""
-        # Test various special characters in keys
-        special_keys = [
-            f"test:key:{uuid.uuid4().hex[:8]}",
-            f"test-key-{uuid.uuid4().hex[:8]}",
-            f"test_key_{uuid.uuid4().hex[:8]}",
-            f"test.key.{uuid.uuid4().hex[:8]}",
-            f"test/key/{uuid.uuid4().hex[:8]}",
-        ]
+        key = key_template.format(unique_id())
+        value = f"value_for_{key}"
         
-        for key in special_keys:
-            value = f"value_for_{key}"
-            
-            # Set and get with special key
-            await upstash_redis.set(key, value)
-            result = await upstash_redis.get(key)
-            assert result == value
+        # Set and get with special key
+        await upstash_redis.set(key, value)
+        result = await upstash_redis.get(key)
+        assert result == value
     
     @pytest.mark.redis
     @pytest.mark.integration
-    async def test_numeric_strings(self, upstash_redis: UpstashRedisClient):
+    @pytest.mark.parametrize("input_val, expected", [
+        ("123", "123"),
+        ("0", "0"),
+        ("-456", "-456"),
+        ("3.14159", "3.14159"),
+        ("1e10", "1e10"),
+    ])
+    async def test_numeric_strings(self, upstash_redis: UpstashRedisClient, input_val: str, expected: str):
         """Test setting and getting numeric string values."""
-        test_cases = [
-            ("123", "123"),
-            ("0", "0"),
-            ("-456", "-456"),
-            ("3.14159", "3.14159"),
-            ("1e10", "1e10"),
-        ]
+        key = f"test_numeric_{unique_id()}"
         
-        for i, (input_val, expected) in enumerate(test_cases):
-            key = f"test_numeric_{i}_{uuid.uuid4().hex[:8]}"
-            
-            await upstash_redis.set(key, input_val)
-            result = await upstash_redis.get(key)
-            assert result == expected
-
+        await upstash_redis.set(key, input_val)
+        result = await upstash_redis.get(key)
+        assert result == expected
 
 class TestRedisKeyOperations:
     """Test Redis key-related operations."""
@@ -190,28 +192,25 @@ class TestRedisKeyOperations:
     @pytest.mark.integration
     async def test_multiple_keys_isolation(self, upstash_redis: UpstashRedisClient):
         """Test that multiple keys are properly isolated."""
-        keys_values = {}
+        keys_values = {
+            f"isolation_test_{i}_{unique_id()}": f"value_{i}_{unique_id()}"
+            for i in range(10)
+        }
         
-        # Create multiple key-value pairs
-        for i in range(10):
-            key = f"isolation_test_{i}_{uuid.uuid4().hex[:8]}"
-            value = f"value_{i}_{uuid.uuid4().hex[:8]}"
-            keys_values[key] = value
-            await upstash_redis.set(key, value)
+        # Create multiple key-value pairs, one pipelined request per phase
+        await upstash_redis.pipeline([["SET", k, v] for k, v in keys_values.items()])
         
         # Verify all keys have correct values
-        for key, expected_value in keys_values.items():
-            result = await upstash_redis.get(key)
-            assert result == expected_value
+        results = await upstash_redis.pipeline([["GET", k] for k in keys_values])
+        assert results == list(keys_values.values())
         
         # Delete half the keys
         keys_to_delete = list(keys_values.keys())[:5]
-        for key in keys_to_delete:
-            await upstash_redis.delete(key)
+        await upstash_redis.pipeline([["DEL", k] for k in keys_to_delete])
         
         # Verify deleted keys are gone and remaining keys are intact
-        for key, expected_value in keys_values.items():
-            result = await upstash_redis.get(key)
+        results = await upstash_redis.pipeline([["GET", k] for k in keys_values])
+        for (key, expected_value), result in zip(keys_values.items(), results):
             if key in keys_to_delete:
                 assert result is None
             else:
@@ -226,7 +225,7 @@ class TestRedisErrorHandling:
     async def test_very_long_key(self, upstash_redis: UpstashRedisClient):
         """Test handling of very long keys."""
         # Redis typically supports keys up to 512MB, but let's test a reasonable long key
-        key = "very_long_key_" + "x" * 1000 + f"_{uuid.uuid4().hex[:8]}"
+        key = f"very_long_key_{LONG_KEY_BODY}_{unique_id()}"
         value = "long_key_value"
         
         try:
@@ -243,21 +242,16 @@ class TestRedisErrorHandling:
     async def test_concurrent_operations(self, upstash_redis: UpstashRedisClient):
         """Test concurrent Redis operations."""
         async def set_get_operation(index: int):
-            key = f"concurrent_{index}_{uuid.uuid4().hex[:8]}"
-            value = f"value_{index}_{uuid.uuid4().hex[:8]}"
+            key = f"concurrent_{index}_{unique_id()}"
+            value = f"value_{index}_{unique_id()}"
             
             await upstash_redis.set(key, value)
             result = await upstash_redis.get(key)
             assert result == value
-            return key
         
         # Run 10 concurrent operations
         tasks = [set_get_operation(i) for i in range(10)]
-        keys = await asyncio.gather(*tasks)
-        
-        # Cleanup
-        for key in keys:
-            await upstash_redis.delete(key)
+        await asyncio.gather(*tasks)
 
 
 class TestRedisDataTypes:
@@ -267,7 +261,7 @@ class TestRedisDataTypes:
     @pytest.mark.integration
     async def test_json_like_strings(self, upstash_redis: UpstashRedisClient):
         """Test storing JSON-like string data."""
-        key = f"test_json_{uuid.uuid4().hex[:8]}"
+        key = f"test_json_{unique_id()}"
         json_value = '{"name": "John", "age": 30, "city": "New York"}'
         
         await upstash_redis.set(key, json_value)
@@ -278,7 +272,7 @@ class TestRedisDataTypes:
     @pytest.mark.integration
     async def test_multiline_strings(self, upstash_redis: UpstashRedisClient):
         """Test storing multiline string data."""
-        key = f"test_multiline_{uuid.uuid4().hex[:8]}"
+        key = f"test_multiline_{unique_id()}"
         multiline_value = """This is line 1
 This is line 2
 This is line 3 with special chars: !@#$%^&*()
@@ -292,19 +286,15 @@ This is line 4 with unicode: 你好世界"""
     @pytest.mark.integration
     async def test_binary_like_strings(self, upstash_redis: UpstashRedisClient):
         """Test storing binary-like string data."""
-        key = f"test_binary_{uuid.uuid4().hex[:8]}"
+        key = f"test_binary_{unique_id()}"
         # Simulate binary data as base64 string
-        import base64
-        binary_data = b"This is binary data with null bytes: \x00\x01\x02\x03"
-        base64_value = base64.b64encode(binary_data).decode('utf-8')
-        
-        await upstash_redis.set(key, base64_value)
+        await upstash_redis.set(key, BASE64_VALUE)
         result = await upstash_redis.get(key)
-        assert result == base64_value
+        assert result == BASE64_VALUE
         
         # Verify we can decode it back
         decoded = base64.b64decode(result)
-        assert decoded == binary_data
+        assert decoded == BINARY_DATA
 
 
 if __name__ == "__main__":
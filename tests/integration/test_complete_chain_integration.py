@@ -18,36 +18,39 @@ the management API flow but skip the actual Redis operations.
 
 import pytest
 import asyncio
+import functools
+import subprocess
 import uuid
 import json
 import os
 from typing import Dict, Any, Optional
 
-from conftest import RedisGateClient, UpstashRedisClient
+from conftest import RedisGateClient, UpstashRedisClient, unique_id
+
+
+@functools.lru_cache(maxsize=1)
+def kubernetes_available() -> bool:
+    """Check if Kubernetes is available (probed once per process)."""
+    # Check for CI environment variable set in GitHub Actions
+    if os.getenv("KUBERNETES_AVAILABLE") == "true":
+        return True
+    
+    # Check if kubectl is available and can connect to a cluster
+    try:
+        result = subprocess.run(
+            ["kubectl", "cluster-info"], 
+            capture_output=True, 
+            text=True, 
+            timeout=10
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+        return False
 
 
 class TestCompleteChainIntegration:
     """Test the complete chain integration workflow for RedisGate."""
     
-    def _is_kubernetes_available(self) -> bool:
-        """Check if Kubernetes is available in the environment."""
-        # Check for CI environment variable set in GitHub Actions
-        if os.getenv("KUBERNETES_AVAILABLE") == "true":
-            return True
-        
-        # Check if kubectl is available and can connect to a cluster
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["kubectl", "cluster-info"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            return False
-    
     @pytest.mark.integration 
     @pytest.mark.api
     async def test_complete_end_to_end_chain(self, client: RedisGateClient):
@@ -58,7 +61,7 @@ class TestCompleteChainIntegration:
         This test validates the entire user journey from account creation to Redis operations.
         """
         # Generate unique test identifiers
-        test_id = uuid.uuid4().hex[:8]
+        test_id = unique_id()
         test_email = f"chaintest-{test_id}@example.com"
         test_username = f"chainuser-{test_id}"
         test_password = "ChainTest123!"
@@ -67,7 +70,7 @@ class TestCompleteChainIntegration:
         api_key_name = f"chain-key-{test_id}"
         
         # Check if Kubernetes is available
-        k8s_available = self._is_kubernetes_available()
+        k8s_available = kubernetes_available()
         print(f"🔍 Kubernetes availability: {'✅ Available' if k8s_available else '⚠️  Not available'}")
         
         # ====================================================================
@@ -123,40 +126,34 @@ class TestCompleteChainIntegration:
         # ====================================================================
         print(f"🔗 STEP 4: Creating Redis instance: {redis_name}")
         
-        # This step will attempt to create a Redis instance via Kubernetes
-        # Success depends on K8s availability
+        # Creating a Redis instance deploys it via Kubernetes; without K8s the call
+        # is skipped up front, and with K8s any failure fails the test
         redis_instance = None
         k8s_deployment_error = None
         
-        try:
+        if k8s_available:
             redis_instance = await client.create_redis_instance(
                 org_id, 
                 redis_name, 
                 memory_limit=256  # 256MB
             )
             print(f"✅ Redis instance created successfully: {redis_instance['id']}")
+        else:
+            k8s_deployment_error = "Kubernetes not available"
+            print(f"⚠️  Skipping Redis instance creation (requires K8s)")
             
-        except Exception as e:
-            k8s_deployment_error = str(e)
-            if k8s_available:
-                print(f"❌ Redis instance creation failed unexpectedly (K8s should be available): {e}")
-                # In CI with K8s, this should not fail - raise the error
-                raise
-            else:
-                print(f"⚠️  Redis instance creation failed (expected without K8s): {e}")
-                
-                # For testing purposes, we'll simulate what the Redis instance data would look like
-                redis_instance = {
-                    "id": str(uuid.uuid4()),
-                    "name": redis_name,
-                    "slug": redis_name.lower().replace("_", "-"),
-                    "organization_id": org_id,
-                    "max_memory": 256 * 1024 * 1024,  # bytes
-                    "status": "pending",
-                    "endpoint_url": f"http://localhost:8080/redis/{redis_name}",
-                    "created_at": "2024-01-01T00:00:00Z"
-                }
-                print(f"📋 Simulated Redis instance for testing: {redis_instance['id']}")
+            # For testing purposes, we'll simulate what the Redis instance data would look like
+            redis_instance = {
+                "id": str(uuid.uuid4()),
+                "name": redis_name,
+                "slug": redis_name.lower().replace("_", "-"),
+                "organization_id": org_id,
+                "max_memory": 256 * 1024 * 1024,  # bytes
+                "status": "pending",
+                "endpoint_url": f"{client.base_url}/redis/{redis_name}",
+                "created_at": "2024-01-01T00:00:00Z"
+            }
+            print(f"📋 Simulated Redis instance for testing: {redis_instance['id']}")
         
         # ====================================================================
         # STEP 5: Create API Key
@@ -166,17 +163,17 @@ class TestCompleteChainIntegration:
         api_key_response = None
         api_key_creation_error = None
         
-        try:
+        if not k8s_deployment_error:
             api_key_response = await client.create_api_key(
                 org_id,
                 api_key_name, 
                 redis_instance["id"]
             )
             print(f"✅ API key created successfully: {api_key_response['api_key']['id']}")
-            
-        except Exception as e:
-            api_key_creation_error = str(e)
-            print(f"⚠️  API key creation failed: {e}")
+        else:
+            # The simulated instance does not exist on the server, so neither can its key
+            api_key_creation_error = "No Redis instance to create a key for"
+            print(f"⚠️  Skipping API key creation (no Redis instance)")
             
             # For testing purposes, simulate API key response
             api_key_response = {
@@ -198,51 +195,41 @@ class TestCompleteChainIntegration:
         print(f"🔗 STEP 6: Testing Redis operations")
         
         redis_operations_successful = False
-        redis_test_error = None
         
         # Only try Redis operations if we have a real Redis instance (no K8s deployment error)
         if not k8s_deployment_error and redis_instance and api_key_response:
-            try:
-                # Initialize Redis client with the created instance
-                redis_client = UpstashRedisClient(
-                    redis_instance.get("endpoint_url", f"http://localhost:8080/redis/{redis_instance['id']}"),
-                    api_key_response["key"]
-                )
-                
-                # Test basic Redis operations
-                test_key = f"chain-test-{test_id}"
-                test_value = f"Hello from chain integration test {test_id}!"
-                
-                # Test SET operation
-                set_result = await redis_client.set(test_key, test_value)
-                assert set_result == "OK"
-                print(f"✅ Redis SET operation successful: {test_key} = {test_value}")
-                
-                # Test GET operation
-                get_result = await redis_client.get(test_key)
-                assert get_result == test_value
-                print(f"✅ Redis GET operation successful: {test_key} = {get_result}")
-                
-                # Test DELETE operation
-                delete_result = await redis_client.delete(test_key)
-                assert delete_result == 1
-                print(f"✅ Redis DELETE operation successful: {test_key}")
-                
-                # Verify key is gone
-                get_deleted_result = await redis_client.get(test_key)
-                assert get_deleted_result is None
-                print(f"✅ Redis key deletion verified: {test_key} does not exist")
-                
-                redis_operations_successful = True
-                
-            except Exception as e:
-                redis_test_error = str(e)
-                if k8s_available:
-                    print(f"❌ Redis operations failed unexpectedly (K8s should be available): {e}")
-                    # In CI with K8s, Redis operations should work
-                    raise
-                else:
-                    print(f"⚠️  Redis operations failed (expected without working Redis): {e}")
+            # Initialize Redis client with the created instance
+            redis_client = UpstashRedisClient(
+                f"{client.base_url}/redis/{redis_instance['id']}",
+                api_key_response["key"]
+            )
+            
+            # Test basic Redis operations
+            test_key = f"chain-test-{test_id}"
+            test_value = f"Hello from chain integration test {test_id}!"
+            
+            # Test SET operation
+            set_result = await redis_client.set(test_key, test_value)
+            assert set_result == "OK"
+            print(f"✅ Redis SET operation successful: {test_key} = {test_value}")
+            
+            # Test GET operation
+            get_result = await redis_client.get(test_key)
+            assert get_result == test_value
+            print(f"✅ Redis GET operation successful: {test_key} = {get_result}")
+            
+            # Test DELETE operation
+            delete_result = await redis_client.delete(test_key)
+            assert delete_result == 1
+            print(f"✅ Redis DELETE operation successful: {test_key}")
+            
+            # Verify key is gone
+            get_deleted_result = await redis_client.get(test_key)
+            assert get_deleted_result is None
+            print(f"✅ Redis key deletion verified: {test_key} does not exist")
+            
+            redis_operations_successful = True
+            
         else:
             if k8s_deployment_error:
                 print(f"⚠️  Skipping Redis operations due to K8s deployment error")
@@ -252,43 +239,39 @@ class TestCompleteChainIntegration:
         # ====================================================================
         # VALIDATION AND SUMMARY
         # ====================================================================
-        print(f"\n🏁 CHAIN INTEGRATION TEST SUMMARY for {test_id}")
-        print(f"=" * 60)
+        # Collected and printed in one write
+        summary = [f"\n🏁 CHAIN INTEGRATION TEST SUMMARY for {test_id}"]
+        summary.append(f"=" * 60)
         
         # Always validate these management API operations
-        print(f"✅ Step 1: User registration - SUCCESS")
-        print(f"✅ Step 2: User authentication - SUCCESS") 
-        print(f"✅ Step 3: Organization creation - SUCCESS")
+        summary.append(f"✅ Step 1: User registration - SUCCESS")
+        summary.append(f"✅ Step 2: User authentication - SUCCESS") 
+        summary.append(f"✅ Step 3: Organization creation - SUCCESS")
         
         if k8s_deployment_error:
-            if k8s_available:
-                print(f"❌ Step 4: Redis instance creation - FAILED (unexpected with K8s)")
-                print(f"    Error: {k8s_deployment_error}")
-            else:
-                print(f"⚠️  Step 4: Redis instance creation - FAILED (K8s required)")
-                print(f"    Error: {k8s_deployment_error}")
+            summary.append(f"⚠️  Step 4: Redis instance creation - SKIPPED (K8s required)")
         else:
-            print(f"✅ Step 4: Redis instance creation - SUCCESS")
+            summary.append(f"✅ Step 4: Redis instance creation - SUCCESS")
             
         if api_key_creation_error:
-            print(f"⚠️  Step 5: API key creation - FAILED")
-            print(f"    Error: {api_key_creation_error}")
+            summary.append(f"⚠️  Step 5: API key creation - SKIPPED")
+            summary.append(f"    Reason: {api_key_creation_error}")
         else:
-            print(f"✅ Step 5: API key creation - SUCCESS")
+            summary.append(f"✅ Step 5: API key creation - SUCCESS")
             
         if redis_operations_successful:
-            print(f"✅ Step 6: Redis operations (SET/GET/DELETE) - SUCCESS")
+            summary.append(f"✅ Step 6: Redis operations (SET/GET/DELETE) - SUCCESS")
         else:
-            print(f"⚠️  Step 6: Redis operations - SKIPPED/FAILED")
-            if redis_test_error:
-                print(f"    Error: {redis_test_error}")
+            summary.append(f"⚠️  Step 6: Redis operations - SKIPPED")
         
-        print(f"\n📊 CHAIN TEST RESULTS:")
-        print(f"   Management API Flow: ✅ COMPLETE")
+        summary.append(f"\n📊 CHAIN TEST RESULTS:")
+        summary.append(f"   Management API Flow: ✅ COMPLETE")
         if k8s_available:
-            print(f"   Redis Operations: {'✅ WORKING' if redis_operations_successful else '❌ FAILED'}")
+            summary.append(f"   Redis Operations: {'✅ WORKING' if redis_operations_successful else '❌ FAILED'}")
         else:
-            print(f"   Redis Operations: {'✅ WORKING' if redis_operations_successful else '⚠️  REQUIRES K8S'}")
+            summary.append(f"   Redis Operations: {'✅ WORKING' if redis_operations_successful else '⚠️  REQUIRES K8S'}")
+        
+        print("\n".join(summary))
         
         # Test assertions - these should always pass for the management API
         assert user_id is not None, "User registration must succeed"
@@ -299,7 +282,6 @@ class TestCompleteChainIntegration:
         
         # Redis operations are required when K8s is available
         if k8s_available:
-            assert not k8s_deployment_error, f"Redis instance creation should succeed with K8s: {k8s_deployment_error}"
             assert redis_operations_successful, "Redis operations should work when K8s is available"
         else:
             # Redis operations are NOT expected to work without K8s 
@@ -320,66 +302,56 @@ class TestCompleteChainIntegration:
 
     @pytest.mark.integration
     @pytest.mark.api
-    async def test_chain_integration_multiple_resources(self, client: RedisGateClient):
+    async def test_chain_integration_multiple_resources(self, authenticated_client: RedisGateClient):
         """
         Test chain integration with multiple organizations and Redis instances.
         
         This validates that the system can handle multiple resources correctly
         and that proper isolation is maintained between different organizations.
         """
-        test_id = uuid.uuid4().hex[:8]
-        test_email = f"multichain-{test_id}@example.com"
-        test_username = f"multiuser-{test_id}"
-        test_password = "MultiChain123!"
+        # Signed in as the session user: this test is about the resources, not the account
+        client = authenticated_client
+        test_id = unique_id()
         
         # Check K8s availability
-        k8s_available = self._is_kubernetes_available()
+        k8s_available = kubernetes_available()
         
         print(f"🔗 MULTI-RESOURCE CHAIN TEST: {test_id}")
         print(f"🔍 Kubernetes availability: {'✅ Available' if k8s_available else '⚠️  Not available'}")
         
-        # Register and login user
-        await client.register_user(test_email, test_username, test_password)
-        await client.login(test_email, test_password)
-        
-        organizations = []
-        redis_instances = []
-        
-        # Create multiple organizations
-        for i in range(3):
-            org_name = f"multi-org-{test_id}-{i}"
-            org = await client.create_organization(
-                org_name,
-                f"Multi-org test organization {i}"
-            )
-            organizations.append(org)
+        # Create multiple organizations concurrently
+        organizations = list(await asyncio.gather(*(
+            client.create_organization(f"multi-org-{test_id}-{i}", f"Multi-org test organization {i}")
+            for i in range(3)
+        )))
+        for i, org in enumerate(organizations):
             print(f"✅ Created organization {i+1}: {org['id']}")
+        
+        async def create_redis_instance(i: int, org: Dict[str, Any]) -> Dict[str, Any]:
+            """Create the Redis instance for one organization (simulated without K8s)."""
+            if not k8s_available:
+                simulated_instance = {
+                    "id": str(uuid.uuid4()),
+                    "name": f"multi-redis-{test_id}-{i}",
+                    "organization_id": org["id"],
+                    "status": "pending"
+                }
+                print(f"📋 Simulated Redis instance {i+1}: {simulated_instance['id']}")
+                return simulated_instance
             
-            # Create Redis instance for each organization
-            try:
-                redis_name = f"multi-redis-{test_id}-{i}"
-                redis_instance = await client.create_redis_instance(
-                    org["id"],
-                    redis_name,
-                    memory_limit=128
-                )
-                redis_instances.append(redis_instance)
-                print(f"✅ Created Redis instance {i+1}: {redis_instance['id']}")
-                
-            except Exception as e:
-                if k8s_available:
-                    print(f"❌ Redis instance creation {i+1} failed unexpectedly (K8s should be available): {e}")
-                    raise
-                else:
-                    # Expected without K8s - create simulated instance
-                    simulated_instance = {
-                        "id": str(uuid.uuid4()),
-                        "name": f"multi-redis-{test_id}-{i}",
-                        "organization_id": org["id"],
-                        "status": "pending"
-                    }
-                    redis_instances.append(simulated_instance)
-                    print(f"📋 Simulated Redis instance {i+1}: {simulated_instance['id']}")
+            redis_name = f"multi-redis-{test_id}-{i}"
+            redis_instance = await client.create_redis_instance(
+                org["id"],
+                redis_name,
+                memory_limit=128
+            )
+            print(f"✅ Created Redis instance {i+1}: {redis_instance['id']}")
+            return redis_instance
+        
+        # Create a Redis instance for each organization concurrently (gather keeps the order)
+        redis_instances = list(await asyncio.gather(*(
+            create_redis_instance(i, org) for i, org in enumerate(organizations)
+        )))
         
         # Validate we created all resources
         assert len(organizations) == 3
@@ -414,13 +386,13 @@ class TestCompleteChainIntegration:
         """
         import time
         
-        test_id = uuid.uuid4().hex[:8]
+        test_id = unique_id()
         test_email = f"perfchain-{test_id}@example.com"
         test_username = f"perfuser-{test_id}"
         test_password = "PerfChain123!"
         
         # Check K8s availability
-        k8s_available = self._is_kubernetes_available()
+        k8s_available = kubernetes_available()
         
         print(f"⏱️  PERFORMANCE CHAIN TEST: {test_id}")
         print(f"🔍 Kubernetes availability: {'✅ Available' if k8s_available else '⚠️  Not available'}")
@@ -428,50 +400,46 @@ class TestCompleteChainIntegration:
         timings = {}
         
         # Time user registration
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.register_user(test_email, test_username, test_password)
-        timings["user_registration"] = time.time() - start_time
+        timings["user_registration"] = time.perf_counter() - start_time
         
         # Time user login
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.login(test_email, test_password)
-        timings["user_login"] = time.time() - start_time
+        timings["user_login"] = time.perf_counter() - start_time
         
         # Time organization creation
-        start_time = time.time()
+        start_time = time.perf_counter()
         org_name = f"perf-org-{test_id}"
         organization = await client.create_organization(org_name, "Performance test org")
-        timings["organization_creation"] = time.time() - start_time
+        timings["organization_creation"] = time.perf_counter() - start_time
         
-        # Time Redis instance creation
-        start_time = time.time()
-        redis_created = False
-        try:
+        # Time Redis instance creation (needs K8s; not attempted without it)
+        redis_created = k8s_available
+        start_time = time.perf_counter()
+        if redis_created:
             redis_name = f"perf-redis-{test_id}"
-            redis_instance = await client.create_redis_instance(
+            await client.create_redis_instance(
                 organization["id"],
                 redis_name, 
                 memory_limit=256
             )
-            timings["redis_instance_creation"] = time.time() - start_time
-            redis_created = True
-        except Exception as e:
-            timings["redis_instance_creation"] = time.time() - start_time
-            if k8s_available:
-                print(f"❌ Redis instance creation failed unexpectedly (K8s should be available): {e}")
-                raise
-            else:
-                redis_created = False
+        timings["redis_instance_creation"] = time.perf_counter() - start_time
         
         # Calculate total time
         total_time = sum(timings.values())
         
-        print(f"📊 PERFORMANCE RESULTS:")
-        print(f"   User Registration: {timings['user_registration']:.3f}s")
-        print(f"   User Login: {timings['user_login']:.3f}s")
-        print(f"   Organization Creation: {timings['organization_creation']:.3f}s")
-        print(f"   Redis Instance Creation: {timings['redis_instance_creation']:.3f}s")
-        print(f"   Total Management API Time: {total_time:.3f}s")
+        # One write for the whole summary, after all timing is done
+        print(
+            f"📊 PERFORMANCE RESULTS:\n"
+            f"   User Registration: {timings['user_registration']:.3f}s\n"
+            f"   User Login: {timings['user_login']:.3f}s\n"
+            f"   Organization Creation: {timings['organization_creation']:.3f}s\n"
+            f"   Redis Instance Creation: {timings['redis_instance_creation']:.3f}s"
+            f"{'' if redis_created else ' (skipped, requires K8s)'}\n"
+            f"   Total Management API Time: {total_time:.3f}s"
+        )
         
         # Performance assertions (reasonable thresholds)
         assert timings["user_registration"] < 5.0, "User registration should complete within 5 seconds"